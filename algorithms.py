@@ -1,124 +1,1155 @@
 import heapq
+import math
+import random
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import accumulate
+from statistics import NormalDist
+from csr_graph import CSRGraph
+from path_cache import PathResult, ShortestPathTree
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsiyonel; yoksa güç iterasyonu saf Python ile yapılır
+    np = None
+
+
+def _bidirectional_dijkstra(start, end, expand):
+    """
+    İki yönlü Dijkstra: başlangıçtan ve hedeften aynı anda arama yapılır,
+    iki kuyruğun tepe mesafeleri toplamı bulunan en iyi buluşma maliyetini
+    geçince durulur. Mesafe/önceki haritaları yalnızca ulaşılan düğümler için
+    oluşturulur. Graf yönsüz olduğundan iki yön de aynı expand'i kullanır.
+
+    Args:
+        expand: düğüm -> (komşu, ağırlık) ikililerini üreten fonksiyon
+
+    Returns:
+        PathResult (düğüm anahtarları expand'in kullandığı anahtarlardır)
+    """
+    if start == end:
+        return PathResult([start], 0)
+
+    inf = float('inf')
+    dist = ({start: 0}, {end: 0})
+    previous = ({start: None}, {end: None})
+    heaps = ([(0, start)], [(0, end)])
+    best, meet = inf, None
+
+    while heaps[0] and heaps[1]:
+        top_forward, top_backward = heaps[0][0][0], heaps[1][0][0]
+        if top_forward + top_backward >= best:
+            break
+        side = 0 if top_forward <= top_backward else 1
+        dist_side, dist_other, prev_side, heap = dist[side], dist[1 - side], previous[side], heaps[side]
+
+        d, current = heapq.heappop(heap)
+        if d > dist_side[current]:
+            continue
+        for neighbor, weight in expand(current):
+            new_dist = d + weight
+            if new_dist < dist_side.get(neighbor, inf):
+                dist_side[neighbor] = new_dist
+                prev_side[neighbor] = current
+                heapq.heappush(heap, (new_dist, neighbor))
+            other = dist_other.get(neighbor)
+            if other is not None and new_dist + other < best:
+                best, meet = new_dist + other, neighbor
+                # Buluşma kenarı current -> neighbor; ileri zincir ona göre bağlanır
+                meet_edge = (side, current)
+
+    if meet is None:
+        return PathResult([], inf)
+
+    # Buluşma kenarının iki ucundan zincirleri geriye doğru izle (O(L))
+    side, current = meet_edge
+    forward_tail, backward_head = (current, meet) if side == 0 else (meet, current)
+    path = []
+    node = forward_tail
+    while node is not None:
+        path.append(node)
+        node = previous[0][node]
+    path.reverse()
+    node = backward_head
+    while node is not None:
+        path.append(node)
+        node = previous[1][node]
+    return PathResult(path, best)
+
+
+def _dijkstra_tree(sources, expand, stop_at=None):
+    """
+    Verilen kaynaklardan (uzaklık 0) Dijkstra; ulaşılan düğümler için
+    uzaklık, önceki düğüm ve ebeveyn kenarı ağırlığı sözlükleri döner.
+    stop_at verilirse içindeki tüm düğümler kesinleşince arama durur
+    (bu durumda diğer düğümlerin uzaklıkları kesin olmayabilir).
+    """
+    inf = float('inf')
+    dist = {s: 0 for s in sources}
+    previous = {s: None for s in sources}
+    parent_weight = {s: 0 for s in sources}
+    remaining = set(stop_at) if stop_at is not None else None
+    pq = [(0, s) for s in sources]
+
+    while pq:
+        d, current = heapq.heappop(pq)
+        if d > dist[current]:
+            continue
+        if remaining is not None:
+            remaining.discard(current)
+            if not remaining:
+                break
+        for neighbor, weight in expand(current):
+            new_dist = d + weight
+            if new_dist < dist.get(neighbor, inf):
+                dist[neighbor] = new_dist
+                previous[neighbor] = current
+                parent_weight[neighbor] = weight
+                heapq.heappush(pq, (new_dist, neighbor))
+    return dist, previous, parent_weight
+
+
+def _as_csr(graph):
+    """SocialGraph veya CSRGraph kabul eden analizler için ortak giriş"""
+    return graph if isinstance(graph, CSRGraph) else graph.freeze()
+
+
+def _brandes_accumulate(csr, source, weighted, betweenness):
+    """
+    Brandes algoritmasının tek kaynak adımı: source'tan en kısa yol DAG'ını
+    çıkarır ve bağımlılıkları (dependency) betweenness dizisine ekler.
+
+    Args:
+        csr: CSRGraph
+        source: kaynak düğüm indeksi
+        weighted: True ise Dijkstra (Edge.weight), False ise BFS (adım sayısı)
+        betweenness: indeks -> skor listesi (yerinde güncellenir)
+    """
+    offsets, neighbors, weights = csr.offsets, csr.neighbors, csr.weights
+    n = csr.num_nodes
+    sigma = [0] * n
+    sigma[source] = 1
+    predecessors = [[] for _ in range(n)]
+    order = []
+
+    if weighted:
+        inf = float('inf')
+        dist = [inf] * n
+        dist[source] = 0
+        settled = bytearray(n)
+        pq = [(0, source)]
+        while pq:
+            d, v = heapq.heappop(pq)
+            if settled[v]: continue
+            settled[v] = 1
+            order.append(v)
+            sigma_v = sigma[v]
+            for pos in range(offsets[v], offsets[v + 1]):
+                w = neighbors[pos]
+                new_dist = d + weights[pos]
+                if new_dist < dist[w]:
+                    dist[w] = new_dist
+                    sigma[w] = sigma_v
+                    predecessors[w] = [v]
+                    heapq.heappush(pq, (new_dist, w))
+                elif new_dist == dist[w] and not settled[w]:
+                    sigma[w] += sigma_v
+                    predecessors[w].append(v)
+    else:
+        dist = [-1] * n
+        dist[source] = 0
+        queue = deque([source])
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            next_level = dist[v] + 1
+            sigma_v = sigma[v]
+            for pos in range(offsets[v], offsets[v + 1]):
+                w = neighbors[pos]
+                if dist[w] < 0:
+                    dist[w] = next_level
+                    queue.append(w)
+                if dist[w] == next_level:
+                    sigma[w] += sigma_v
+                    predecessors[w].append(v)
+
+    # Geriye doğru bağımlılık birikimi
+    delta = [0.0] * n
+    for w in reversed(order):
+        coeff = (1 + delta[w]) / sigma[w]
+        for v in predecessors[w]:
+            delta[v] += sigma[v] * coeff
+        if w != source:
+            betweenness[w] += delta[w]
+
+
+
+def _sssp_lengths(csr, source, weighted):
+    """source'tan tüm düğümlere uzaklık listesi (ulaşılamayanlar inf)"""
+    offsets, neighbors, weights = csr.offsets, csr.neighbors, csr.weights
+    inf = float('inf')
+    dist = [inf] * csr.num_nodes
+    dist[source] = 0
+    if weighted:
+        pq = [(0, source)]
+        while pq:
+            d, v = heapq.heappop(pq)
+            if d > dist[v]: continue
+            for pos in range(offsets[v], offsets[v + 1]):
+                w = neighbors[pos]
+                new_dist = d + weights[pos]
+                if new_dist < dist[w]:
+                    dist[w] = new_dist
+                    heapq.heappush(pq, (new_dist, w))
+    else:
+        queue = deque([source])
+        while queue:
+            v = queue.popleft()
+            next_level = dist[v] + 1
+            for pos in range(offsets[v], offsets[v + 1]):
+                w = neighbors[pos]
+                if dist[w] == inf:
+                    dist[w] = next_level
+                    queue.append(w)
+    return dist
+
+
+def _betweenness_chunk(csr, sources, weighted):
+    """Bir kaynak grubunun kısmi aracılık vektörü"""
+    betweenness = [0.0] * csr.num_nodes
+    for source in sources:
+        _brandes_accumulate(csr, source, weighted, betweenness)
+    return betweenness
+
+
+def _closeness_chunk(csr, sources, weighted):
+    """Her kaynak için (indeks, toplam_uzaklık, ulaşılan_düğüm_sayısı, 1/uzaklık toplamı)"""
+    inf = float('inf')
+    result = []
+    for source in sources:
+        total = 0
+        reached = 0
+        harmonic = 0.0
+        for d in _sssp_lengths(csr, source, weighted):
+            if d != inf:
+                total += d
+                reached += 1
+                if d > 0:
+                    harmonic += 1 / d
+        result.append((source, total, reached, harmonic))
+    return result
+
+
+def _closeness_score(total, reached, n, normalization):
+    """
+    Toplam uzaklıktan yakınlık skoru. reached kaynağın kendisi dahil bileşen
+    boyutudur; "graph" Wasserman-Faust ölçeklemesi, "component" yalnızca
+    bileşen içi ortalama uzaklığın tersi, None ise 1 / toplam uzaklık.
+    """
+    if total <= 0:
+        return 0.0
+    if normalization == "graph":
+        return (reached - 1) / total * (reached - 1) / (n - 1)
+    if normalization == "component":
+        return (reached - 1) / total
+    return 1 / total
+
+
+def _harmonic_score(harmonic, reached, n, normalization):
+    """1/uzaklık toplamından harmonik skor; "graph" n-1'e, "component" bileşen boyutu-1'e böler"""
+    if normalization == "graph":
+        return harmonic / (n - 1) if n > 1 else 0.0
+    if normalization == "component":
+        return harmonic / (reached - 1) if reached > 1 else 0.0
+    return harmonic
+
+
+def _component_sizes(csr, values=None):
+    """
+    Her düğüm indeksi için içinde bulunduğu bağlı bileşenin boyutu. values
+    verilirse ikinci liste olarak her düğümün bileşenindeki values toplamı da döner.
+    """
+    offsets, neighbors = csr.offsets, csr.neighbors
+    n = csr.num_nodes
+    sizes = [0] * n
+    sums = [0.0] * n if values is not None else None
+    for root in range(n):
+        if sizes[root]:
+            continue
+        sizes[root] = -1
+        component = [root]
+        for vertex in component:
+            for pos in range(offsets[vertex], offsets[vertex + 1]):
+                neighbor = neighbors[pos]
+                if not sizes[neighbor]:
+                    sizes[neighbor] = -1
+                    component.append(neighbor)
+        total = sum(values[vertex] for vertex in component) if values is not None else 0.0
+        for vertex in component:
+            sizes[vertex] = len(component)
+            if sums is not None:
+                sums[vertex] = total
+    return sizes if values is None else (sizes, sums)
+
+
+def _pruned_sweep(csr, source, weighted, size, harmonic, limit, floors=None, floor_sum=0.0,
+                  min_weight=0.0):
+    """
+    Top-k için erken kesilebilen tek kaynak taraması. Her düğüm kesinleştiğinde
+    kalan düğümlerin uzaklıkları için alt sınırdan toplam uzaklığa alt sınır
+    (harmonikte 1/d toplamına üst sınır) hesaplanır. Kuyruktaki (keşfedilmiş)
+    düğümler en az mevcut seviye d uzaktadır; hiç keşfedilmemiş bir u'ya giden
+    yolun son kenarı u'ya değen en hafif kenardan (floors[u]) kısa olamayacağı
+    için u en az d + floors[u] uzaktadır (BFS'te seviye + 1). floor_sum,
+    kaynağın bileşenindeki floors toplamıdır; harmonik sınır düğüm bazında
+    toplanamadığından floors'un en küçüğü (min_weight) kullanılır.
+
+    Toplam uzaklığın alt sınırı limit'e ulaşırsa (harmonikte 1/d toplamının
+    üst sınırı limit'e düşerse) kaynak top-k'ya giremez ve None döner; aksi
+    halde (toplam, 1/uzaklık toplamı).
+    """
+    offsets, neighbors, weights = csr.offsets, csr.neighbors, csr.weights
+    dist = {source: 0}
+    total = 0
+    inverse = 0.0
+
+    if weighted:
+        settled = 0
+        seen_floor = floors[source]
+        pq = [(0, source)]
+        while pq:
+            d, v = heapq.heappop(pq)
+            if d > dist[v]: continue
+            settled += 1
+            total += d
+            if d > 0:
+                inverse += 1 / d
+                waiting = len(dist) - settled   # keşfedilmiş, kesinleşmemiş
+                unseen = size - len(dist)
+                if harmonic:
+                    if inverse + waiting / d + unseen / (d + min_weight) <= limit:
+                        return None
+                elif total + (waiting + unseen) * d + floor_sum - seen_floor >= limit:
+                    return None
+            for pos in range(offsets[v], offsets[v + 1]):
+                w = neighbors[pos]
+                new_dist = d + weights[pos]
+                old = dist.get(w)
+                if old is None:
+                    seen_floor += floors[w]
+                elif new_dist >= old:
+                    continue
+                dist[w] = new_dist
+                heapq.heappush(pq, (new_dist, w))
+    else:
+        # BFS'te level seviyesindeki bir düğüm çıkarıldığında o seviyenin tamamı
+        # keşfedilmiştir; keşfedilmemiş düğümler en az level + 1 uzaktadır
+        queue = deque([source])
+        while queue:
+            v = queue.popleft()
+            level = dist[v]
+            rest = size - len(dist)
+            if harmonic:
+                if inverse + rest / (level + 1) <= limit:
+                    return None
+            elif total + rest * (level + 1) >= limit:
+                return None
+            for pos in range(offsets[v], offsets[v + 1]):
+                w = neighbors[pos]
+                if w not in dist:
+                    dist[w] = level + 1
+                    total += level + 1
+                    inverse += 1 / (level + 1)
+                    queue.append(w)
+    return total, inverse
+
+
+def _score_limit(threshold, size, n, harmonic, normalization):
+    """
+    Skor eşiğini tarama büyüklüğüne çevirir: bileşen boyutu size olan bir
+    kaynak, toplam uzaklığı bu değere ulaşırsa (harmonikte 1/d toplamı bu
+    değerin altında kalırsa) eşiği geçemez.
+    """
+    inf = float('inf')
+    if harmonic:
+        scale = _harmonic_score(1.0, size, n, normalization)
+        return threshold / scale if scale > 0 else inf
+    if threshold <= 0:
+        return inf  # pozitif her skor eşiği geçer
+    if normalization == "graph":
+        return (size - 1) * (size - 1) / ((n - 1) * threshold)
+    if normalization == "component":
+        return (size - 1) / threshold
+    return 1 / threshold
+
+
+def _edge_strengths(csr, weighted):
+    """
+    Kenar başına bağ gücü (CSR kenar sırasıyla). Edge.weight benzemezlik
+    (uzaklık) olduğundan güç 1 / weight'tir; ağırlıksızda her kenar 1.
+    """
+    if not weighted:
+        return [1.0] * len(csr.neighbors)
+    return [1.0 / w if w > 0 else 1.0 for w in csr.weights]
+
+
+def _start_vector(csr, start):
+    """
+    Güç iterasyonu başlangıç vektörü (toplamı 1). start önceki bir sonuçsa
+    (düğüm_id -> skor) ondan başlanır (warm start); sonuçta olmayan yeni
+    düğümler bilinen skorların ortalamasını alır.
+    """
+    n = csr.num_nodes
+    if not start:
+        return [1.0 / n] * n
+    known = [start.get(node_id) for node_id in csr.ids]
+    values = [v for v in known if v is not None and v > 0]
+    fill = sum(values) / len(values) if values else 1.0 / n
+    x = [v if v is not None and v > 0 else fill for v in known]
+    total = sum(x)
+    return [v / total for v in x]
+
+
+def _propagator(csr, edge_scale):
+    """
+    y[j] = sum(edge_scale[e] * x[i]) (e = i -> j kenarları) seyrek çarpımını
+    yapan fonksiyon. NumPy varsa np.bincount ile vektörize, yoksa CSR
+    üzerinde döngü; dönüş tipi girdiyle aynı (ndarray ya da liste).
+    """
+    offsets, neighbors = csr.offsets, csr.neighbors
+    n = csr.num_nodes
+    if np is not None:
+        rows = np.repeat(np.arange(n), np.diff(np.asarray(memoryview(offsets))))
+        cols = np.asarray(memoryview(neighbors))
+        scale = np.asarray(edge_scale, dtype=np.float64)
+        return lambda x: np.bincount(cols, weights=x[rows] * scale, minlength=n)
+
+    def propagate(x):
+        y = [0.0] * n
+        for i in range(n):
+            xi = x[i]
+            if xi:
+                for pos in range(offsets[i], offsets[i + 1]):
+                    y[neighbors[pos]] += edge_scale[pos] * xi
+        return y
+    return propagate
+
+
+# Süreç havuzundaki her işçi grafı yalnızca bir kez (initializer ile) alır
+_worker_csr = None
+
+
+def _init_worker(csr):
+    global _worker_csr
+    _worker_csr = csr
+
+
+def _call_in_worker(chunk_fn, sources, weighted):
+    return chunk_fn(_worker_csr, sources, weighted)
+
+
+def _map_sources(csr, chunk_fn, weighted, workers):
+    """
+    Kaynak düğümleri parçalara bölüp chunk_fn'i çalıştırır.
+    workers > 1 ise parçalar ProcessPoolExecutor'a dağıtılır; her işçiye CSR
+    görüntüsü bir kez gönderilir. Kısmi sonuçların listesi döner.
+    """
+    n = csr.num_nodes
+    if not workers or workers <= 1 or n < 2:
+        return [chunk_fn(csr, range(n), weighted)]
+
+    # Derece dağılımı dengesiz olabileceğinden kaynaklar aralıklı dağıtılır
+    num_chunks = min(n, workers * 4)
+    chunks = [range(i, n, num_chunks) for i in range(num_chunks)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(csr,)) as executor:
+        return list(executor.map(partial(_call_in_worker, chunk_fn), chunks, [weighted] * num_chunks))
+
 
 class Algorithms:
     @staticmethod
-    def bfs(graph, start_id):
-        visited = set()
-        queue = [start_id]
-        visited.add(start_id)
-        result = []
+    def bfs_iter(graph, start_id):
+        """
+        Genişlik öncelikli gezintiyi tembel (lazy) olarak üretir; çağıran taraf
+        istediği anda durabilir.
+
+        Yields:
+            (düğüm_id, derinlik, ebeveyn_id) - başlangıç düğümünün ebeveyni None
+        """
+        adjacency = graph.adjacency_list
+        visited = {start_id}
+        queue = deque([(start_id, 0, None)])
         while queue:
-            vertex = queue.pop(0)
-            result.append(vertex)
-            for neighbor in graph.adjacency_list.get(vertex, []):
+            vertex, depth, parent = queue.popleft()
+            yield vertex, depth, parent
+            for neighbor in adjacency.get(vertex, []):
                 if neighbor not in visited:
                     visited.add(neighbor)
-                    queue.append(neighbor)
-        return result
+                    queue.append((neighbor, depth + 1, vertex))
 
     @staticmethod
-    def dfs(graph, start_id):
+    def bfs_levels(graph, start_id):
+        """
+        BFS katmanlarını sırayla üretir: (derinlik, [düğüm_id, ...]).
+        Yalnızca o anki katman bellekte tutulur.
+        """
+        level = []
+        current_depth = 0
+        for vertex, depth, _ in Algorithms.bfs_iter(graph, start_id):
+            if depth != current_depth:
+                yield current_depth, level
+                level = []
+                current_depth = depth
+            level.append(vertex)
+        if level:
+            yield current_depth, level
+
+    @staticmethod
+    def bfs(graph, start_id):
+        return [vertex for vertex, _, _ in Algorithms.bfs_iter(graph, start_id)]
+
+    @staticmethod
+    def dfs_iter(graph, start_id):
+        """
+        Derinlik öncelikli gezintiyi (yinelemeli, özyinelemesiz) tembel olarak
+        üretir. Komşular küçük id'den büyüğe doğru ziyaret edilir.
+
+        Yields:
+            (düğüm_id, derinlik, ebeveyn_id) - başlangıç düğümünün ebeveyni None
+        """
+        adjacency = graph.adjacency_list
         visited = set()
-        stack = [start_id]
-        result = []
+        stack = [(start_id, 0, None)]
         while stack:
-            vertex = stack.pop()
+            vertex, depth, parent = stack.pop()
             if vertex not in visited:
                 visited.add(vertex)
-                result.append(vertex)
-                neighbors = sorted(graph.adjacency_list.get(vertex, []), reverse=True)
-                stack.extend(neighbors)
-        return result
+                yield vertex, depth, parent
+                neighbors = sorted(adjacency.get(vertex, []), reverse=True)
+                stack.extend((neighbor, depth + 1, vertex) for neighbor in neighbors if neighbor not in visited)
+
+    @staticmethod
+    def dfs(graph, start_id):
+        return [vertex for vertex, _, _ in Algorithms.dfs_iter(graph, start_id)]
 
     @staticmethod
     def dijkstra(graph, start_id, end_id):
-        distances = {node: float('inf') for node in graph.nodes}
-        distances[start_id] = 0
-        previous = {node: None for node in graph.nodes}
-        pq = [(0, start_id)]
-        
-        while pq:
-            d, current = heapq.heappop(pq)
-            if current == end_id: break
-            if d > distances[current]: continue
-            
-            for neighbor in graph.adjacency_list.get(current, []):
-                weight = graph.get_edge_weight(current, neighbor)
-                new_dist = d + weight
-                if new_dist < distances[neighbor]:
-                    distances[neighbor] = new_dist
-                    previous[neighbor] = current
-                    heapq.heappush(pq, (new_dist, neighbor))
-        
-        path = []
-        curr = end_id
-        if distances[end_id] == float('inf'): return [], float('inf')
-        while curr is not None:
-            path.insert(0, curr)
-            curr = previous[curr]
-        return path, distances[end_id]
+        """
+        İki nokta arası en kısa yol (iki yönlü Dijkstra). Arama iki uçtan
+        birlikte ilerlediği için büyük graflarda düğümlerin yalnızca küçük bir
+        kısmı gezilir.
+
+        Returns:
+            PathResult(path, cost) - yol yoksa ([], inf)
+        """
+        if start_id not in graph.nodes or end_id not in graph.nodes:
+            return PathResult([], float('inf'))
+
+        # Graf yönsüz: iki uçtan birinin önbellekteki ağacı yeterlidir
+        cache = getattr(graph, 'path_cache', None)
+        if cache is not None:
+            version = graph.version
+            tree = cache.get(start_id, version)
+            if tree is not None:
+                return tree.path_to(end_id)
+            tree = cache.get(end_id, version)
+            if tree is not None:
+                path, cost = tree.path_to(start_id)
+                return PathResult(path[::-1], cost)
+            # Önbelleğe sığmayabilecek ağaçlar kurulmaz (put onları atardı); bu
+            # boyuttaki graflarda her sorgu iki yönlü aramayla yanıtlanır
+            if len(graph.nodes) <= cache.max_entries and cache.should_cache(start_id):
+                return Algorithms.single_source_dijkstra(graph, start_id).path_to(end_id)
+
+        return _bidirectional_dijkstra(start_id, end_id, graph.neighbors_with_weights)
+
+    @staticmethod
+    def single_source_dijkstra(graph, source_id, use_cache=True):
+        """
+        source_id'den ulaşılabilen tüm düğümlere en kısa yol ağacı.
+        Graf bir yol önbelleği taşıyorsa (SocialGraph.path_cache) ağaç sürümü
+        güncel olduğu sürece oradan döner, yoksa hesaplanıp önbelleğe eklenir.
+
+        Returns:
+            ShortestPathTree - tree.distance(t), tree.path_to(t)
+        """
+        cache = getattr(graph, 'path_cache', None) if use_cache else None
+        version = getattr(graph, 'version', None)
+        if cache is not None:
+            tree = cache.get(source_id, version)
+            if tree is not None:
+                return tree
+
+        sources = (source_id,) if source_id in graph.nodes else ()
+        dist, previous, parent_weight = _dijkstra_tree(sources, graph.neighbors_with_weights)
+        tree = ShortestPathTree(source_id, dist, previous, parent_weight, version)
+        if cache is not None and dist:
+            cache.put(tree)
+        return tree
+
+    @staticmethod
+    def multi_source_dijkstra(graph, source_ids):
+        """
+        Birden çok kaynaktan aynı anda Dijkstra: her düğümün en yakın kaynağa
+        uzaklığı ve tüm kaynaklar için ortak tek bir önceki (predecessor) ağacı.
+        Tek bir arama ile hesaplanır, kaynak sayısı kadar tekrar edilmez.
+
+        Returns:
+            ShortestPathTree - source kaynakların tuple'ı; path_to(t) t'ye en
+            yakın kaynaktan başlar, nearest_source(t) o kaynağı verir
+        """
+        sources = tuple(dict.fromkeys(s for s in source_ids if s in graph.nodes))
+        dist, previous, parent_weight = _dijkstra_tree(sources, graph.neighbors_with_weights)
+        return ShortestPathTree(sources, dist, previous, parent_weight, getattr(graph, 'version', None))
+
+    @staticmethod
+    def many_to_many(graph, source_ids, target_ids):
+        """
+        Her kaynak-hedef çifti için en kısa yol uzaklığı.
+
+        Çift başına ayrı Dijkstra yerine taraf başına tek arama yapılır: graf
+        yönsüz olduğundan aramalar kaynak ve hedeflerden az olan taraftan
+        başlatılır, her arama karşı taraftaki tüm düğümler kesinleşince durur.
+        Yol önbelleğinde ağacı bulunan düğümler için arama hiç yapılmaz.
+
+        Returns:
+            {kaynak: {hedef: uzaklık}} - ulaşılamayan hedefler için inf
+        """
+        nodes = graph.nodes
+        sources = [s for s in dict.fromkeys(source_ids) if s in nodes]
+        targets = [t for t in dict.fromkeys(target_ids) if t in nodes]
+        inf = float('inf')
+        swap = len(targets) < len(sources)
+        origins, others = (targets, sources) if swap else (sources, targets)
+
+        cache = getattr(graph, 'path_cache', None)
+        version = getattr(graph, 'version', None)
+        rows = {}
+        for origin in origins:
+            tree = cache.get(origin, version) if cache is not None else None
+            if tree is not None:
+                dist = tree.dist
+            else:
+                dist = _dijkstra_tree((origin,), graph.neighbors_with_weights, stop_at=others)[0]
+            rows[origin] = {other: dist.get(other, inf) for other in others}
+
+        if swap:
+            return {s: {t: rows[t][s] for t in targets} for s in sources}
+        return {s: rows[s] for s in sources}
 
     @staticmethod
-    def a_star(graph, start_id, end_id):
-        def heuristic(id1, id2):
-            return abs(graph.nodes[id1].aktiflik - graph.nodes[id2].aktiflik)
+    def a_star(graph, start_id, end_id, landmarks=None):
+        """
+        A* ile en kısa yol. Varsayılan sezgisel |aktiflik farkı|'dır; formülle
+        hesaplanan ağırlıklar en az uçlarının aktiflik farkı kadar olduğundan
+        bu sınır kabul edilebilirdir. set_edge_weight ile elle atanan
+        ağırlıklar sınırı bozabilir; bu yüzden daha kısa yoldan ulaşılan düğüm
+        yeniden açılır (eski kuyruk kayıtları atlanır). Dönen yolun kenar
+        toplamı her zaman cost'a eşittir, ancak sezgisel bozulduysa yolun en
+        kısa olması garanti değildir.
+
+        Args:
+            landmarks: opsiyonel LandmarkIndex; verilirse ALT alt sınırı da
+                kullanılır (iki sınırın büyüğü). İndeks grafın
+                güncel haliyle kurulmuş olmalıdır; graf sonradan değiştiyse yok sayılır.
+
+        Returns:
+            PathResult(path, cost) - yol yoksa ([], inf)
+        """
+        if start_id not in graph.nodes or end_id not in graph.nodes:
+            return PathResult([], float('inf'))
+        nodes = graph.nodes
+        target_aktiflik = nodes[end_id].aktiflik
+
+        if landmarks is not None and not landmarks.is_current(graph):
+            landmarks = None  # graf değişmiş: eski tablolar kabul edilebilir olmayabilir
+        index = landmarks.csr.index if landmarks is not None else {}
+        if start_id in index and end_id in index:
+            alt = landmarks.heuristic_to(index[start_id], index[end_id])
+
+            def heuristic(node_id):
+                a = abs(nodes[node_id].aktiflik - target_aktiflik)
+                i = index.get(node_id)
+                h = alt(i) if i is not None else 0.0
+                return h if h > a else a
+        else:
+            def heuristic(node_id):
+                return abs(nodes[node_id].aktiflik - target_aktiflik)
+
+        inf = float('inf')
+        h_start = heuristic(start_id)
+        if h_start == inf:
+            return PathResult([], inf)
+        open_set = [(h_start, 0, start_id)]
+        came_from = {start_id: None}
+        g_score = {start_id: 0}
 
-        open_set = [(0, start_id)]
-        came_from = {}
-        g_score = {node: float('inf') for node in graph.nodes}
-        g_score[start_id] = 0
-        f_score = {node: float('inf') for node in graph.nodes}
-        f_score[start_id] = heuristic(start_id, end_id)
-        
         while open_set:
-            _, current = heapq.heappop(open_set)
+            _, g_current, current = heapq.heappop(open_set)
+            if g_current > g_score[current]:
+                continue  # sonradan daha kısa yoldan ulaşılmış; eski kayıt
             if current == end_id:
                 path = []
-                while current in came_from:
+                while current is not None:
                     path.append(current)
                     current = came_from[current]
-                path.append(start_id)
-                return path[::-1], g_score[end_id]
-            
-            for neighbor in graph.adjacency_list.get(current, []):
-                weight = graph.get_edge_weight(current, neighbor)
-                tentative_g = g_score[current] + weight
-                if tentative_g < g_score[neighbor]:
+                path.reverse()
+                return PathResult(path, g_score[end_id])
+
+            for neighbor, weight in graph.neighbors_with_weights(current):
+                tentative_g = g_current + weight
+                if tentative_g < g_score.get(neighbor, inf):
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g
-                    f_score[neighbor] = tentative_g + heuristic(neighbor, end_id)
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
-        return [], float('inf')
+                    heapq.heappush(open_set, (tentative_g + heuristic(neighbor), tentative_g, neighbor))
+        return PathResult([], inf)
+
+    @staticmethod
+    def calculate_centrality(graph, k=5):
+        """
+        Derece merkeziliğine göre en etkili k düğüm; (Node, derece) listesi döner.
+        Graf bir derece indeksi tutuyorsa yalnızca en üst kovalar okunur,
+        yoksa tüm düğümler üzerinde heap tabanlı seçim yapılır.
+        """
+        degree_index = getattr(graph, 'degree_index', None)
+        if degree_index is not None and len(degree_index) == len(graph.nodes):
+            return [(graph.nodes[nid], deg) for nid, deg in degree_index.top_k(k)]
+
+        adjacency = graph.adjacency_list
+        top = heapq.nlargest(k, graph.nodes, key=lambda nid: len(adjacency.get(nid, [])))
+        return [(graph.nodes[nid], len(adjacency.get(nid, []))) for nid in top]
+
+    @staticmethod
+    def betweenness_centrality(graph, weighted=True, normalized=True, workers=None):
+        """
+        Brandes algoritması ile aracılık (betweenness) merkeziliği.
+        Tüm kaynaklardan tek bir en kısa yol taraması yapar: ağırlıksız O(V*E),
+        ağırlıklı O(V*E + V^2 log V). Eşit uzunluktaki tüm en kısa yollar sayılır.
+
+        Args:
+            graph: SocialGraph veya CSRGraph
+            weighted: True ise Edge.weight, False ise adım sayısı kullanılır
+            normalized: True ise skorlar (n-1)(n-2)/2 düğüm çiftine bölünür
+            workers: >1 ise kaynaklar bu kadar sürece paylaştırılır
+
+        Returns:
+            dict: düğüm_id -> aracılık skoru
+        """
+        csr = _as_csr(graph)
+        n = csr.num_nodes
+        betweenness = [0.0] * n
+        for partial_scores in _map_sources(csr, _betweenness_chunk, weighted, workers):
+            for i, score in enumerate(partial_scores):
+                betweenness[i] += score
+
+        # Yönsüz grafta her çift iki kez (iki uçtan) sayıldı
+        if normalized:
+            scale = 1 / ((n - 1) * (n - 2)) if n > 2 else 0.0
+        else:
+            scale = 0.5
+        return {csr.ids[i]: score * scale for i, score in enumerate(betweenness)}
+
+    @staticmethod
+    def approximate_betweenness(graph, k=None, time_budget=None, strategy="uniform",
+                                weighted=True, normalized=True, confidence=0.95, seed=None):
+        """
+        Örneklemeli (yaklaşık) aracılık merkeziliği. Tüm kaynaklar yerine k pivot
+        kaynak seçilir; her pivotun Brandes bağımlılıkları seçilme olasılığına
+        bölünerek tam skorun yansız tahmini elde edilir.
+
+        Args:
+            graph: SocialGraph veya CSRGraph
+            k: pivot sayısı (k ve time_budget verilmezse min(n, 100))
+            time_budget: saniye; verilirse süre dolana kadar (en fazla k) pivot alınır
+            strategy: "uniform" (eşit olasılık) veya "degree" (dereceyle orantılı)
+            weighted, normalized: betweenness_centrality ile aynı
+            confidence: güven aralığı düzeyi (ör. 0.95)
+            seed: tekrarlanabilir örnekleme için rastgele tohum
+
+        Returns:
+            dict: {"scores": {id: tahmin}, "bounds": {id: güven yarı genişliği},
+                   "samples": kullanılan pivot sayısı, "confidence": confidence}
+            Gerçek skorun yaklaşık confidence olasılıkla tahmin ± bound içinde
+            olması beklenir (normal yaklaşım; k >= 2 gerekir).
+        """
+        if strategy not in ("uniform", "degree"):
+            raise ValueError(f"Bilinmeyen örnekleme stratejisi: {strategy}")
+
+        csr = _as_csr(graph)
+        n = csr.num_nodes
+        if k is None and time_budget is None:
+            k = min(n, 100)
+        rng = random.Random(seed)
+
+        if strategy == "degree" and csr.num_edges > 0:
+            degrees = [csr.degree(i) for i in range(n)]
+            total_degree = sum(degrees)
+            probabilities = [d / total_degree for d in degrees]
+            cum_weights = list(accumulate(degrees))
+            draw = lambda: rng.choices(range(n), cum_weights=cum_weights)[0]
+        else:
+            probabilities = [1 / n] * n if n else []
+            draw = lambda: rng.randrange(n)
+
+        sums = [0.0] * n
+        squares = [0.0] * n
+        samples = 0
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        while n and (k is None or samples < k):
+            if deadline is not None and samples and time.perf_counter() >= deadline:
+                break
+            source = draw()
+            contribution = [0.0] * n
+            _brandes_accumulate(csr, source, weighted, contribution)
+            inverse_p = 1 / probabilities[source]
+            for i, value in enumerate(contribution):
+                if value:
+                    x = value * inverse_p
+                    sums[i] += x
+                    squares[i] += x * x
+            samples += 1
+
+        if normalized:
+            scale = 1 / ((n - 1) * (n - 2)) if n > 2 else 0.0
+        else:
+            scale = 0.5
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+
+        scores = {}
+        bounds = {}
+        for i in range(n):
+            mean = sums[i] / samples if samples else 0.0
+            if samples > 1:
+                variance = max(squares[i] / samples - mean * mean, 0.0) * samples / (samples - 1)
+                bound = z * math.sqrt(variance / samples) * scale
+            else:
+                bound = float('inf')
+            scores[csr.ids[i]] = mean * scale
+            bounds[csr.ids[i]] = bound
+        return {"scores": scores, "bounds": bounds, "samples": samples, "confidence": confidence}
+
+    @staticmethod
+    def closeness_centrality(graph, weighted=True, normalization="graph", workers=None):
+        """
+        Yakınlık (closeness) merkeziliği. Bağlı olmayan graflarda her düğüm
+        yalnızca ulaşabildiği düğümlere göre hesaplanır.
+
+        Args:
+            graph: SocialGraph veya CSRGraph
+            weighted: True ise Edge.weight, False ise adım sayısı kullanılır
+            normalization: "graph" ise skor ulaşılan oranla ölçeklenir
+                (Wasserman-Faust; küçük bileşenler yüksek skor alamaz),
+                "component" ise yalnızca bileşen içinde (r-1) / toplam uzaklık,
+                None ise 1 / toplam uzaklık
+            workers: >1 ise kaynaklar bu kadar sürece paylaştırılır
+
+        Returns:
+            dict: düğüm_id -> yakınlık skoru
+        """
+        if normalization not in ("graph", "component", None):
+            raise ValueError(f"Geçersiz normalizasyon: {normalization}")
+        csr = _as_csr(graph)
+        n = csr.num_nodes
+        closeness = [0.0] * n
+        for part in _map_sources(csr, _closeness_chunk, weighted, workers):
+            for source, total, reached, _ in part:
+                closeness[source] = _closeness_score(total, reached, n, normalization)
+        # Parçalar kaynakları aralıklı paylaşır; sonuç düğüm sırasıyla kurulur
+        return {csr.ids[i]: score for i, score in enumerate(closeness)}
+
+    @staticmethod
+    def harmonic_centrality(graph, weighted=True, normalization="graph", workers=None):
+        """
+        Harmonik merkezilik: diğer düğümlere uzaklıkların terslerinin toplamı.
+        Ulaşılamayan düğümler 1/inf = 0 katkı yaptığından bağlı olmayan
+        graflarda da ek düzeltme gerektirmez.
+
+        Args:
+            graph: SocialGraph veya CSRGraph
+            weighted: True ise Edge.weight, False ise adım sayısı kullanılır
+            normalization: "graph" ise n-1'e, "component" ise düğümün bileşen
+                boyutu-1'e bölünür, None ise ham toplam
+            workers: >1 ise kaynaklar bu kadar sürece paylaştırılır
+
+        Returns:
+            dict: düğüm_id -> harmonik skor
+        """
+        if normalization not in ("graph", "component", None):
+            raise ValueError(f"Geçersiz normalizasyon: {normalization}")
+        csr = _as_csr(graph)
+        n = csr.num_nodes
+        scores = [0.0] * n
+        for part in _map_sources(csr, _closeness_chunk, weighted, workers):
+            for source, _, reached, harmonic in part:
+                scores[source] = _harmonic_score(harmonic, reached, n, normalization)
+        return {csr.ids[i]: score for i, score in enumerate(scores)}
+
+    @staticmethod
+    def top_k_closeness(graph, k=5, weighted=True, harmonic=False, normalization="graph"):
+        """
+        Yakınlık (ya da harmonik) skoru en yüksek k düğüm; tüm düğümlerin
+        skorunu hesaplamadan bulunur. Kaynaklar dereceye göre azalan sırada
+        taranır; ilk k sonuçtan sonra her tarama, skorunun o ana kadarki k.
+        en iyi skoru geçemeyeceği kesinleştiği anda kesilir. Ağırlıksız (BFS)
+        taramada çoğu kaynak ilk birkaç seviyede elenir; ağırlıklı taramada
+        sınırlar daha gevşektir ve kazanç birkaç katla sınırlı kalır (binlerce
+        düğümde saniyeler sürer, daha büyük graflar için approximate_harmonic).
+        Sınırda eşit skorlu düğümlerden önce taranan kalır.
+
+        Args:
+            graph: SocialGraph veya CSRGraph
+            k: istenen düğüm sayısı
+            weighted: True ise Edge.weight, False ise adım sayısı kullanılır
+            harmonic: True ise harmonik merkezilik sıralanır
+            normalization: closeness_centrality / harmonic_centrality ile aynı
+
+        Returns:
+            list: (düğüm_id, skor) listesi, skora göre azalan
+        """
+        if normalization not in ("graph", "component", None):
+            raise ValueError(f"Geçersiz normalizasyon: {normalization}")
+        csr = _as_csr(graph)
+        n = csr.num_nodes
+        if k <= 0 or n == 0:
+            return []
+        floors = min_weight = None
+        if weighted:
+            # Her düğüme değen en hafif kenar: o düğüme olan uzaklığın alt sınırı
+            offsets, weights = csr.offsets, csr.weights
+            floors = [min(weights[offsets[i]:offsets[i + 1]], default=0.0) for i in range(n)]
+            min_weight = min(csr.weights, default=0.0)
+            sizes, floor_sums = _component_sizes(csr, floors)
+        else:
+            sizes = _component_sizes(csr)
+
+        top = []  # (skor, sıra, indeks) min-heap; top[0] k. en iyi
+        no_limit = float('-inf') if harmonic else float('inf')
+        for order, source in enumerate(sorted(range(n), key=csr.degree, reverse=True)):
+            size = sizes[source]
+            # Eşik (k. en iyi skor) tarama büyüklüğüne çevrilir; sınır ona ulaşınca tarama kesilir
+            limit = _score_limit(top[0][0], size, n, harmonic, normalization) if len(top) == k else no_limit
+            result = _pruned_sweep(csr, source, weighted, size, harmonic, limit,
+                                   floors, floor_sums[source] if weighted else 0.0, min_weight)
+            if result is None:
+                continue
+            total, inverse = result
+            if harmonic:
+                score = _harmonic_score(inverse, size, n, normalization)
+            else:
+                score = _closeness_score(total, size, n, normalization)
+            entry = (score, -order, source)
+            if len(top) < k:
+                heapq.heappush(top, entry)
+            elif entry > top[0]:
+                heapq.heapreplace(top, entry)
+        return [(csr.ids[source], score) for score, _, source in sorted(top, reverse=True)]
+
+    @staticmethod
+    def approximate_harmonic(graph, k=None, time_budget=None, weighted=True, normalization="graph", seed=None):
+        """
+        Örneklemeli harmonik merkezilik. Rastgele k pivot kaynaktan birer
+        tarama yapılır; yönsüz grafta d(p, u) = d(u, p) olduğundan her tarama
+        tüm düğümlerin tahminine katkı verir: H(u) ~ n / k * toplam(1 / d(p, u)).
+        Tam hesabın ya da top-k taramasının sürmeyeceği çok büyük graflar için.
+
+        Args:
+            graph: SocialGraph veya CSRGraph
+            k: pivot sayısı (k ve time_budget verilmezse min(n, 100))
+            time_budget: saniye; verilirse süre dolana kadar (en fazla k) pivot alınır
+            weighted, normalization: harmonic_centrality ile aynı
+            seed: tekrarlanabilir örnekleme için rastgele tohum
+
+        Returns:
+            dict: düğüm_id -> tahmini harmonik skor
+        """
+        if normalization not in ("graph", "component", None):
+            raise ValueError(f"Geçersiz normalizasyon: {normalization}")
+        csr = _as_csr(graph)
+        n = csr.num_nodes
+        if k is None and time_budget is None:
+            k = min(n, 100)
+        rng = random.Random(seed)
+        inf = float('inf')
+
+        sums = [0.0] * n
+        samples = 0
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        while n and (k is None or samples < k):
+            if deadline is not None and samples and time.perf_counter() >= deadline:
+                break
+            for i, d in enumerate(_sssp_lengths(csr, rng.randrange(n), weighted)):
+                if 0 < d < inf:
+                    sums[i] += 1 / d
+            samples += 1
+
+        sizes = _component_sizes(csr)
+        scale = n / samples if samples else 0.0
+        return {csr.ids[i]: _harmonic_score(sums[i] * scale, sizes[i], n, normalization) for i in range(n)}
+
+    @staticmethod
+    def pagerank(graph, alpha=0.85, weighted=True, tol=1e-6, max_iter=100, start=None):
+        """
+        PageRank, seyrek güç iterasyonu ile. Yönsüz grafta her kenar iki yönlü
+        bağlantıdır; ağırlıklıda bir düğümden komşularına geçiş olasılığı bağ
+        gücüyle (1 / Edge.weight) orantılıdır. Komşusu olmayan düğümlerin
+        skoru tüm düğümlere eşit dağıtılır.
+
+        Args:
+            graph: SocialGraph veya CSRGraph
+            alpha: sönümleme katsayısı
+            weighted: True ise Edge.weight'ten türetilen bağ gücü kullanılır
+            tol: skor vektöründeki toplam değişim n * tol'un altına inince durulur
+            max_iter: en fazla iterasyon sayısı
+            start: önceki bir pagerank sonucu; graf az değiştiyse iterasyon
+                ondan başlar ve birkaç adımda yakınsar
+
+        Returns:
+            dict: düğüm_id -> skor (toplamı 1)
+        """
+        csr = _as_csr(graph)
+        n = csr.num_nodes
+        if n == 0:
+            return {}
+        offsets = csr.offsets
+        strengths = _edge_strengths(csr, weighted)
+        out_strength = [sum(strengths[offsets[i]:offsets[i + 1]]) for i in range(n)]
+        # Geçiş olasılığı: kenar gücü / kaynağın toplam gücü
+        edge_scale = [strengths[pos] / out_strength[i]
+                      for i in range(n) for pos in range(offsets[i], offsets[i + 1])]
+        dangling = [i for i in range(n) if out_strength[i] == 0]
+        propagate = _propagator(csr, edge_scale)
+
+        x = _start_vector(csr, start)
+        if np is not None:
+            x = np.asarray(x)
+            dangling = np.asarray(dangling, dtype=np.intp)
+        for _ in range(max_iter):
+            flow = propagate(x)
+            if np is not None:
+                teleport = (alpha * float(x[dangling].sum()) + 1 - alpha) / n
+                new_x = alpha * flow + teleport
+                error = float(np.abs(new_x - x).sum())
+            else:
+                teleport = (alpha * sum(x[i] for i in dangling) + 1 - alpha) / n
+                new_x = [alpha * f + teleport for f in flow]
+                error = sum(abs(a - b) for a, b in zip(new_x, x))
+            x = new_x
+            if error < n * tol:
+                break
+        else:
+            print(f"PageRank {max_iter} iterasyonda yakınsamadı (tol={tol})")
+        return {csr.ids[i]: float(score) for i, score in enumerate(x)}
 
     @staticmethod
-    def calculate_centrality(graph):
-        degrees = []
-        for nid in graph.nodes:
-            deg = len(graph.adjacency_list.get(nid, []))
-            degrees.append((graph.nodes[nid], deg))
-        return sorted(degrees, key=lambda x: x[1], reverse=True)[:5]
+    def eigenvector_centrality(graph, weighted=True, tol=1e-6, max_iter=100, start=None):
+        """
+        Özvektör merkeziliği: komşuları merkezi olan düğüm merkezidir.
+        x <- x + A x güç iterasyonu ile komşuluk matrisinin baskın özvektörü
+        bulunur (kaydırma, iki parçalı graflarda salınımı önler). Bağlı
+        olmayan graflarda skor, en büyük özdeğerli bileşende yoğunlaşır.
+
+        Args:
+            graph: SocialGraph veya CSRGraph
+            weighted: True ise A'nın girdileri bağ gücü (1 / Edge.weight)
+            tol, max_iter, start: pagerank ile aynı
+
+        Returns:
+            dict: düğüm_id -> skor (Öklid normu 1)
+        """
+        csr = _as_csr(graph)
+        n = csr.num_nodes
+        if n == 0:
+            return {}
+        propagate = _propagator(csr, _edge_strengths(csr, weighted))
+
+        x = _start_vector(csr, start)
+        if np is not None:
+            x = np.asarray(x)
+            x /= np.linalg.norm(x)
+        else:
+            norm = math.sqrt(sum(v * v for v in x))
+            x = [v / norm for v in x]
+        for _ in range(max_iter):
+            flow = propagate(x)
+            if np is not None:
+                new_x = x + flow
+                new_x /= np.linalg.norm(new_x)
+                error = float(np.abs(new_x - x).sum())
+            else:
+                new_x = [a + b for a, b in zip(x, flow)]
+                norm = math.sqrt(sum(v * v for v in new_x))
+                new_x = [v / norm for v in new_x]
+                error = sum(abs(a - b) for a, b in zip(new_x, x))
+            x = new_x
+            if error < n * tol:
+                break
+        else:
+            print(f"Özvektör merkeziliği {max_iter} iterasyonda yakınsamadı (tol={tol})")
+        return {csr.ids[i]: float(score) for i, score in enumerate(x)}
 
     @staticmethod
     def welsh_powell(graph):
-        sorted_nodes = sorted(graph.nodes.keys(), key=lambda n: len(graph.adjacency_list[n]), reverse=True)
-        colors = ["#FF5733", "#33FF57", "#3357FF", "#F0FF33", "#FF33F0", "#33FFF6"]
+        """
+        Welsh-Powell renklendirme. Düğümler dereceye göre azalan sırada gezilir;
+        her renk sınıfı için o renge boyanan düğümlerin komşuları bir "yasaklı"
+        kümede toplanır, böylece her sınıf O(V + E) sürede oluşturulur.
+
+        Returns:
+            dict: düğüm_id -> renk sınıfı (0, 1, 2, ...)
+        """
+        adjacency = graph.adjacency_list
+        uncolored = sorted(graph.nodes.keys(), key=lambda n: len(adjacency.get(n, [])), reverse=True)
         node_colors = {}
-        color_idx = 0
-        
-        for node in sorted_nodes:
-            if node in node_colors: continue
-            current_color = colors[color_idx % len(colors)]
-            node_colors[node] = current_color
-            for candidate in sorted_nodes:
-                if candidate in node_colors: continue
-                is_neighbor = False
-                for colored_node in [n for n, c in node_colors.items() if c == current_color]:
-                    if candidate in graph.adjacency_list.get(colored_node, []):
-                        is_neighbor = True
-                        break
-                if not is_neighbor:
-                    node_colors[candidate] = current_color
-            color_idx += 1
+        color = 0
+
+        while uncolored:
+            forbidden = set()
+            remaining = []
+            for node in uncolored:
+                if node in forbidden:
+                    remaining.append(node)
+                    continue
+                node_colors[node] = color
+                forbidden.update(adjacency.get(node, []))
+            uncolored = remaining
+            color += 1
+        return node_colors
+
+    @staticmethod
+    def dsatur(graph):
+        """
+        DSatur renklendirme: her adımda komşularında en çok farklı renk bulunan
+        (doygunluğu en yüksek) düğüm, eşitlikte derecesi yüksek olan boyanır.
+        Genellikle Welsh-Powell'dan daha az renk kullanır. O((V + E) log V).
+
+        Returns:
+            dict: düğüm_id -> renk sınıfı (0, 1, 2, ...)
+        """
+        adjacency = graph.adjacency_list
+        neighbor_colors = {node: set() for node in graph.nodes}
+        node_colors = {}
+        # (-doygunluk, -derece, id); güncel olmayan kayıtlar çekilirken atlanır
+        heap = [(0, -len(adjacency.get(node, [])), node) for node in graph.nodes]
+        heapq.heapify(heap)
+
+        while heap:
+            neg_saturation, neg_degree, node = heapq.heappop(heap)
+            if node in node_colors or -neg_saturation != len(neighbor_colors[node]):
+                continue
+            used = neighbor_colors[node]
+            color = 0
+            while color in used:
+                color += 1
+            node_colors[node] = color
+            for neighbor in adjacency.get(node, []):
+                if neighbor in node_colors:
+                    continue
+                colors = neighbor_colors[neighbor]
+                if color not in colors:
+                    colors.add(color)
+                    heapq.heappush(heap, (-len(colors), -len(adjacency[neighbor]), neighbor))
         return node_colors
 
     @staticmethod
@@ -131,4 +1162,146 @@ class Algorithms:
                 component = Algorithms.bfs(graph, node_id)
                 components.append(component)
                 for v in component: visited.add(v)
-        return components
\ No newline at end of file
+        return components
+
+class CSRAlgorithms:
+    """
+    Algorithms sınıfındaki analizlerin CSRGraph (SocialGraph.freeze()) üzerinde
+    çalışan sürümleri. Girdi ve çıktılar orijinal düğüm id'leriyle verilir,
+    dönüş biçimleri Algorithms ile aynıdır.
+    """
+
+    @staticmethod
+    def bfs(csr, start_id):
+        offsets, neighbors, ids = csr.offsets, csr.neighbors, csr.ids
+        start = csr.index[start_id]
+        visited = bytearray(csr.num_nodes)
+        visited[start] = 1
+        queue = deque([start])
+        result = []
+        while queue:
+            vertex = queue.popleft()
+            result.append(ids[vertex])
+            for pos in range(offsets[vertex], offsets[vertex + 1]):
+                neighbor = neighbors[pos]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+        return result
+
+    @staticmethod
+    def dfs(csr, start_id):
+        offsets, neighbors, ids = csr.offsets, csr.neighbors, csr.ids
+        visited = bytearray(csr.num_nodes)
+        stack = [csr.index[start_id]]
+        result = []
+        while stack:
+            vertex = stack.pop()
+            if not visited[vertex]:
+                visited[vertex] = 1
+                result.append(ids[vertex])
+                # Algorithms.dfs ile aynı sıra: küçük id'li komşu önce ziyaret edilir
+                row = neighbors[offsets[vertex]:offsets[vertex + 1]]
+                stack.extend(sorted(row, key=ids.__getitem__, reverse=True))
+        return result
+
+    @staticmethod
+    def _reconstruct(csr, previous, end):
+        path = []
+        curr = end
+        while curr != -1:
+            path.append(csr.ids[curr])
+            curr = previous[curr]
+        path.reverse()
+        return path
+
+    @staticmethod
+    def dijkstra(csr, start_id, end_id):
+        """İki yönlü Dijkstra; PathResult(path, cost) döner"""
+        if start_id not in csr.index or end_id not in csr.index:
+            return PathResult([], float('inf'))
+        offsets, neighbors, weights = csr.offsets, csr.neighbors, csr.weights
+
+        def expand(current):
+            for pos in range(offsets[current], offsets[current + 1]):
+                yield neighbors[pos], weights[pos]
+
+        path, cost = _bidirectional_dijkstra(csr.index[start_id], csr.index[end_id], expand)
+        ids = csr.ids
+        return PathResult([ids[i] for i in path], cost)
+
+    @staticmethod
+    def a_star(csr, start_id, end_id, landmarks=None):
+        """
+        A*; landmarks (aynı csr üzerinde kurulmuş LandmarkIndex) verilirse ALT
+        sınırı aktiflik farkıyla birlikte (büyüğü) sezgisel olarak kullanılır.
+        """
+        if start_id not in csr.index or end_id not in csr.index:
+            return PathResult([], float('inf'))
+        offsets, neighbors, weights, aktiflik = csr.offsets, csr.neighbors, csr.weights, csr.aktiflik
+        n = csr.num_nodes
+        start, end = csr.index[start_id], csr.index[end_id]
+        target_aktiflik = aktiflik[end]
+
+        if landmarks is not None and landmarks.csr is csr:
+            alt = landmarks.heuristic_to(start, end)
+
+            def heuristic(i):
+                a = aktiflik[i] - target_aktiflik
+                h = alt(i)
+                return h if h > abs(a) else abs(a)
+        else:
+            def heuristic(i):
+                return abs(aktiflik[i] - target_aktiflik)
+
+        h_start = heuristic(start)
+        if h_start == float('inf'):
+            return PathResult([], float('inf'))
+
+        g_score = array('d', [float('inf')]) * n
+        previous = array('i', [-1]) * n
+        g_score[start] = 0
+        open_set = [(h_start, start)]
+
+        while open_set:
+            _, current = heapq.heappop(open_set)
+            if current == end:
+                return PathResult(CSRAlgorithms._reconstruct(csr, previous, end), g_score[end])
+
+            g_current = g_score[current]
+            for pos in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[pos]
+                tentative_g = g_current + weights[pos]
+                if tentative_g < g_score[neighbor]:
+                    previous[neighbor] = current
+                    g_score[neighbor] = tentative_g
+                    heapq.heappush(open_set, (tentative_g + heuristic(neighbor), neighbor))
+        return PathResult([], float('inf'))
+
+    @staticmethod
+    def calculate_centrality(csr, k=5):
+        """En yüksek dereceli k düğüm; (düğüm_id, derece) listesi döner"""
+        offsets, ids = csr.offsets, csr.ids
+        top = heapq.nlargest(k, range(csr.num_nodes), key=lambda i: offsets[i + 1] - offsets[i])
+        return [(ids[i], offsets[i + 1] - offsets[i]) for i in top]
+
+    @staticmethod
+    def find_connected_components(csr):
+        offsets, neighbors, ids = csr.offsets, csr.neighbors, csr.ids
+        visited = bytearray(csr.num_nodes)
+        components = []
+        for root in range(csr.num_nodes):
+            if visited[root]: continue
+            visited[root] = 1
+            queue = deque([root])
+            component = []
+            while queue:
+                vertex = queue.popleft()
+                component.append(ids[vertex])
+                for pos in range(offsets[vertex], offsets[vertex + 1]):
+                    neighbor = neighbors[pos]
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        queue.append(neighbor)
+            components.append(component)
+        return components
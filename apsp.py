@@ -0,0 +1,224 @@
+"""
+Tüm çiftler arası en kısa yollar (APSP - All Pairs Shortest Paths).
+
+İki arka uç vardır:
+    - floyd_warshall: NumPy ile vektörize Floyd-Warshall, O(V^3). Her adımda
+      tüm matris tek bir np.minimum ile güncellenir; yoğun ve küçük graflar için.
+    - dijkstra: CSR dizileri üzerinde her kaynaktan Dijkstra (ağırlıksızsa BFS),
+      O(V * E log V). Seyrek graflar için; kaynaklar süreçlere dağıtılabilir.
+
+Matris varsayılan olarak float32 tutulur (float64'ün yarısı kadar yer). out
+ile bir dosya yolu verilirse satırlar parça parça hesaplanıp doğrudan belleğe
+eşlenmiş (memory-mapped) dosyaya yazılır; böylece RAM'i aşan matrisler de
+üretilebilir. NumPy yoksa satırlar array.array olarak tutulur.
+"""
+import mmap
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from algorithms import _as_csr, _sssp_lengths, _init_worker, _call_in_worker
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsiyonel
+    np = None
+
+_TYPECODES = {'float32': 'f', 'float64': 'd'}
+
+
+class DistanceMatrix:
+    """
+    n x n uzaklık matrisi ve ondan türetilen özetler. Satır/sütun sırası
+    ids dizisidir; ulaşılamayan çiftler inf'tir.
+    """
+
+    def __init__(self, ids, rows):
+        """
+        Args:
+            ids: indeks -> düğüm id
+            rows: NumPy matrisi/memmap ya da satır dizilerinin listesi
+        """
+        self.ids = ids
+        self.index = {node_id: i for i, node_id in enumerate(ids)}
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.ids)
+
+    def distance(self, id1, id2):
+        return float(self.rows[self.index[id1]][self.index[id2]])
+
+    def row(self, node_id):
+        """node_id'den tüm düğümlere uzaklıklar (ids sırasıyla)"""
+        return self.rows[self.index[node_id]]
+
+    def _row_blocks(self, block=1024):
+        """Matrisi satır blokları halinde gez (memmap'te tamamı belleğe alınmaz)"""
+        for start in range(0, len(self.ids), block):
+            yield start, self.rows[start:start + block]
+
+    def eccentricity(self):
+        """
+        Her düğüm için ulaşabildiği en uzak düğüme uzaklık. Bağlı olmayan
+        graflarda yalnızca ulaşılabilen düğümler dikkate alınır.
+
+        Returns:
+            dict: düğüm_id -> eksantriklik
+        """
+        ids = self.ids
+        result = {}
+        inf = float('inf')
+        for start, block in self._row_blocks():
+            if np is not None and isinstance(block, np.ndarray):
+                finite = np.where(np.isfinite(block), block, -np.inf)
+                for offset, value in enumerate(finite.max(axis=1).tolist()):
+                    result[ids[start + offset]] = value if value != -inf else 0.0
+            else:
+                for offset, row in enumerate(block):
+                    result[ids[start + offset]] = max((d for d in row if d != inf), default=0.0)
+        return result
+
+    def diameter(self):
+        """Ulaşılabilir çiftler arasındaki en büyük en kısa yol uzaklığı"""
+        return max(self.eccentricity().values(), default=0.0)
+
+    def radius(self):
+        """En küçük eksantriklik"""
+        return min(self.eccentricity().values(), default=0.0)
+
+    def average_path_length(self):
+        """Ulaşılabilir farklı düğüm çiftleri üzerinden ortalama en kısa yol uzaklığı"""
+        total = 0.0
+        pairs = 0
+        inf = float('inf')
+        for _, block in self._row_blocks():
+            if np is not None and isinstance(block, np.ndarray):
+                finite = np.isfinite(block)
+                total += float(block[finite].sum(dtype=np.float64))
+                pairs += int(finite.sum()) - finite.shape[0]  # köşegen (0) çıkarılır
+            else:
+                for row in block:
+                    for d in row:
+                        if d != inf:
+                            total += d
+                            pairs += 1
+                    pairs -= 1
+        return total / pairs if pairs > 0 else 0.0
+
+    def __repr__(self):
+        return f"DistanceMatrix(nodes={len(self.ids)})"
+
+
+def _apsp_chunk(csr, sources, weighted, typecode='f'):
+    """Ardışık kaynak bloğunun uzaklık satırları; tek bir bayt dizisi olarak"""
+    block = array(typecode)
+    for source in sources:
+        block.extend(_sssp_lengths(csr, source, weighted))
+    return sources.start, block.tobytes()
+
+
+def _allocate(n, dtype, out):
+    """Sonuç matrisi: NumPy dizisi/memmap ya da (NumPy yoksa) satır dizileri"""
+    if np is not None:
+        if out is not None:
+            return np.memmap(out, dtype=dtype, mode='w+', shape=(n, n))
+        return np.empty((n, n), dtype=dtype)
+    if out is not None:
+        with open(out, 'wb') as f:
+            f.truncate(n * n * array(_TYPECODES[dtype]).itemsize)
+        with open(out, 'r+b') as f:
+            view = memoryview(mmap.mmap(f.fileno(), 0)) if n else memoryview(b'')
+        flat = view.cast(_TYPECODES[dtype])
+        return [flat[i * n:(i + 1) * n] for i in range(n)]
+    return [array(_TYPECODES[dtype], [0.0]) * n for _ in range(n)]
+
+
+def _store_block(matrix, start, data, n, typecode):
+    """_apsp_chunk çıktısını matrisin start. satırından itibaren yaz"""
+    if np is not None:
+        block = np.frombuffer(data, dtype=np.float32 if typecode == 'f' else np.float64).reshape(-1, n)
+        matrix[start:start + len(block)] = block
+        return
+    block = array(typecode)
+    block.frombytes(data)
+    for r in range(len(block) // n):
+        matrix[start + r][:] = block[r * n:(r + 1) * n]
+
+
+def _repeated_dijkstra(csr, weighted, dtype, out, workers, chunk_rows):
+    n = csr.num_nodes
+    typecode = _TYPECODES[dtype]
+    matrix = _allocate(n, dtype, out)
+    chunks = [range(i, min(i + chunk_rows, n)) for i in range(0, n, chunk_rows)]
+    chunk_fn = partial(_apsp_chunk, typecode=typecode)
+
+    if not workers or workers <= 1 or len(chunks) < 2:
+        for sources in chunks:
+            start, data = chunk_fn(csr, sources, weighted)
+            _store_block(matrix, start, data, n, typecode)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(csr,)) as executor:
+            for start, data in executor.map(partial(_call_in_worker, chunk_fn), chunks,
+                                            [weighted] * len(chunks)):
+                _store_block(matrix, start, data, n, typecode)
+    return matrix
+
+
+def _floyd_warshall(csr, weighted, dtype, out):
+    n = csr.num_nodes
+    matrix = _allocate(n, dtype, out)
+    matrix[:] = np.inf
+    offsets = np.asarray(memoryview(csr.offsets))
+    neighbors = np.asarray(memoryview(csr.neighbors))
+    sources = np.repeat(np.arange(n), np.diff(offsets))
+    if weighted:
+        matrix[sources, neighbors] = np.asarray(memoryview(csr.weights))
+    else:
+        matrix[sources, neighbors] = 1
+    np.fill_diagonal(matrix, 0)
+
+    # D = min(D, D[:, k] + D[k, :]) - her k için tek vektörize güncelleme
+    for k in range(n):
+        np.minimum(matrix, matrix[:, k, None] + matrix[None, k, :], out=matrix)
+    return matrix
+
+
+def all_pairs_shortest_paths(graph, method="auto", weighted=True, dtype="float32",
+                             out=None, workers=None, chunk_rows=256):
+    """
+    Tüm düğüm çiftleri arasındaki en kısa yol uzaklık matrisi.
+
+    Args:
+        graph: SocialGraph, CompactSocialGraph ya da CSRGraph
+        method: "floyd_warshall", "dijkstra" ya da "auto" (NumPy varsa ve graf
+            yoğun ve küçükse Floyd-Warshall, aksi halde tekrarlı Dijkstra)
+        weighted: True ise kenar ağırlıkları, False ise adım sayısı
+        dtype: "float32" (varsayılan) ya da "float64"
+        out: verilirse matris bu dosyaya belleğe eşlenmiş olarak yazılır
+        workers: >1 ise Dijkstra satırları bu kadar süreçte hesaplanır
+        chunk_rows: Dijkstra'da bir seferde hesaplanıp yazılan satır sayısı
+
+    Returns:
+        DistanceMatrix
+    """
+    if dtype not in _TYPECODES:
+        raise ValueError(f"Geçersiz dtype: {dtype} (float32 ya da float64 olmalı)")
+    if method not in ("auto", "floyd_warshall", "dijkstra"):
+        raise ValueError(f"Geçersiz yöntem: {method}")
+
+    csr = _as_csr(graph)
+    n = csr.num_nodes
+    if method == "auto":
+        dense = n > 0 and len(csr.neighbors) >= 0.1 * n * n
+        method = "floyd_warshall" if np is not None and dense and n <= 2000 else "dijkstra"
+    if method == "floyd_warshall":
+        if np is None:
+            raise ValueError("Floyd-Warshall için NumPy gerekli (pip install numpy)")
+        matrix = _floyd_warshall(csr, weighted, dtype, out)
+    else:
+        matrix = _repeated_dijkstra(csr, weighted, dtype, out, workers, max(1, chunk_rows))
+
+    if np is not None and isinstance(matrix, np.memmap):
+        matrix.flush()
+    return DistanceMatrix(list(csr.ids), matrix)
@@ -0,0 +1,112 @@
+import json
+import os
+
+
+class ChangeJournal:
+    """
+    SocialGraph değişiklikleri için yalnızca sona eklenen (append-only) günlük.
+
+    Her mutasyon dosyaya tek satırlık bir JSON kaydı olarak eklenir
+    ({"op": "add_edge", "source": 1, "target": 2} gibi); böylece tek bir
+    düzenlemenin disk maliyeti tüm CSV/JSON dosyasını yeniden yazmak yerine
+    O(1) olur. Ana dosya (taban) yalnızca sıkıştırma (compact) sırasında
+    yeniden yazılır ve günlük boşaltılır. Program beklenmedik şekilde
+    kapanırsa taban yüklendikten sonra replay ile kayıtlar yeniden uygulanır.
+    """
+
+    def __init__(self, path, compact_every=500):
+        """
+        Args:
+            path: günlük dosyası (yoksa oluşturulur)
+            compact_every: bu kadar kayıt birikince needs_compaction True döner
+        """
+        self.path = path
+        self.compact_every = compact_every
+        self.pending = sum(1 for _ in self.entries())
+        self._file = open(path, 'a', encoding='utf-8')
+        # Yarıda kalmış son satırın yeni kayıtlarla birleşmemesi için satırı kapat
+        if self._file.tell() > 0:
+            with open(path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self._file.write("\n")
+
+    def append(self, op, **fields):
+        """Bir değişiklik kaydını günlüğün sonuna ekle ve diske aktar"""
+        record = {"op": op, **fields}
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+        self._file.flush()
+        self.pending += 1
+
+    def entries(self):
+        """
+        Günlükteki kayıtlar, yazılma sırasıyla. Yazılırken yarıda kalmış
+        (bozuk) satırlar atlanır.
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"Günlük kaydı okunamadı, atlanıyor: {line.strip()[:50]}")
+
+    def replay(self, graph):
+        """
+        Günlükteki değişiklikleri (tabanı yüklenmiş) grafa uygular.
+        Uygulanan kayıtlar tekrar günlüğe yazılmaz.
+
+        Returns:
+            int: uygulanan kayıt sayısı
+        """
+        from node import Node
+
+        applied = 0
+        with graph.journal_paused():
+            for record in self.entries():
+                op = record.get("op")
+                if op == "add_node":
+                    graph.add_node(Node(record["id"], record["name"], record["aktiflik"], record["etkilesim"]))
+                elif op == "update_node":
+                    graph.update_node(record["id"], record["name"], record["aktiflik"], record.get("etkilesim"))
+                elif op == "remove_node":
+                    graph.remove_node(record["id"])
+                elif op == "add_edge":
+                    graph.add_edge(record["source"], record["target"])
+                elif op == "remove_edge":
+                    graph.remove_edge(record["source"], record["target"])
+                elif op == "set_weight":
+                    graph.set_edge_weight(record["source"], record["target"], record["weight"])
+                else:
+                    print(f"Bilinmeyen günlük kaydı: {op}")
+                    continue
+                applied += 1
+        return applied
+
+    def needs_compaction(self):
+        return self.pending >= self.compact_every
+
+    def compact(self, write_base):
+        """
+        Tabanı yeniden yazıp günlüğü boşaltır.
+
+        Args:
+            write_base: grafın tamamını ana dosya(lar)a yazan fonksiyon; başarısızsa
+                False döndürmeli ya da hata fırlatmalıdır, bu durumda günlük korunur
+        """
+        if write_base() is False:
+            return False
+        self._file.close()
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self.pending = 0
+        return True
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __repr__(self):
+        return f"ChangeJournal(path='{self.path}', pending={self.pending})"
@@ -0,0 +1,361 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+
+from csr_graph import CSRGraph
+from graph import read_csv_records
+from weight_engine import weights_from_node_arrays
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsiyonel
+    np = None
+
+
+class NodeView:
+    """Kompakt graftaki bir düğüm; Node ile aynı alanları sütunlardan okur"""
+    __slots__ = ('_graph', '_index')
+
+    def __init__(self, graph, index):
+        self._graph = graph
+        self._index = index
+
+    @property
+    def id(self):
+        return self._graph.node_ids[self._index]
+
+    @property
+    def name(self):
+        return self._graph.names[self._index]
+
+    @property
+    def aktiflik(self):
+        return self._graph.aktiflik[self._index]
+
+    @property
+    def etkilesim(self):
+        return self._graph.etkilesim[self._index]
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "aktiflik": self.aktiflik,
+            "etkilesim": self.etkilesim
+        }
+
+    # Görünümler her erişimde yeniden oluşturulduğundan eşitlik id üzerinden
+    def __eq__(self, other):
+        return isinstance(other, NodeView) and other._graph is self._graph and other._index == self._index
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __repr__(self):
+        return f"Node(id={self.id}, name='{self.name}')"
+
+
+class EdgeView:
+    """Kompakt graftaki bir kenar; Edge ile aynı alanları sütunlardan okur"""
+    __slots__ = ('_graph', '_index')
+
+    def __init__(self, graph, index):
+        self._graph = graph
+        self._index = index
+
+    @property
+    def source(self):
+        return NodeView(self._graph, self._graph.edge_src[self._index])
+
+    @property
+    def target(self):
+        return NodeView(self._graph, self._graph.edge_dst[self._index])
+
+    @property
+    def source_baglanti(self):
+        return self._graph.degree_at(self._graph.edge_src[self._index])
+
+    @property
+    def target_baglanti(self):
+        return self._graph.degree_at(self._graph.edge_dst[self._index])
+
+    @property
+    def weight(self):
+        return self._graph.edge_weights[self._index]
+
+    def __eq__(self, other):
+        return isinstance(other, EdgeView) and other._graph is self._graph and other._index == self._index
+
+    def __hash__(self):
+        return hash((self._graph.edge_src[self._index], self._graph.edge_dst[self._index]))
+
+    def __repr__(self):
+        return f"Edge({self.source.id} -> {self.target.id}, weight={self.weight:.2f})"
+
+
+class _NodeMapping(Mapping):
+    """graph.nodes yerine geçen id -> NodeView eşlemesi (görünümler saklanmaz)"""
+    __slots__ = ('_graph',)
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, node_id):
+        return NodeView(self._graph, self._graph.index[node_id])
+
+    def __contains__(self, node_id):
+        return node_id in self._graph.index
+
+    def __iter__(self):
+        return iter(self._graph.node_ids)
+
+    def __len__(self):
+        return len(self._graph.node_ids)
+
+
+class _EdgeList(Sequence):
+    """graph.edges yerine geçen EdgeView dizisi"""
+    __slots__ = ('_graph',)
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [EdgeView(self._graph, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return EdgeView(self._graph, index)
+
+    def __len__(self):
+        return len(self._graph.edge_src)
+
+
+class _NeighborMapping(Mapping):
+    """Bir düğümün komşuları: komşu_id -> EdgeView"""
+    __slots__ = ('_graph', '_index')
+
+    def __init__(self, graph, index):
+        self._graph = graph
+        self._index = index
+
+    def __getitem__(self, neighbor_id):
+        graph = self._graph
+        pos = graph.find_slot(self._index, graph.index.get(neighbor_id, -1))
+        if pos < 0:
+            raise KeyError(neighbor_id)
+        return EdgeView(graph, graph.slot_edges[pos])
+
+    def __contains__(self, neighbor_id):
+        graph = self._graph
+        return graph.find_slot(self._index, graph.index.get(neighbor_id, -1)) >= 0
+
+    def __iter__(self):
+        graph = self._graph
+        ids, neighbors = graph.node_ids, graph.slot_neighbors
+        for pos in range(graph.offsets[self._index], graph.offsets[self._index + 1]):
+            yield ids[neighbors[pos]]
+
+    def __len__(self):
+        return self._graph.degree_at(self._index)
+
+
+class _AdjacencyMapping(Mapping):
+    """graph.adjacency_list yerine geçen id -> komşu eşlemesi"""
+    __slots__ = ('_graph',)
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, node_id):
+        return _NeighborMapping(self._graph, self._graph.index[node_id])
+
+    def __contains__(self, node_id):
+        return node_id in self._graph.index
+
+    def __iter__(self):
+        return iter(self._graph.node_ids)
+
+    def __len__(self):
+        return len(self._graph.node_ids)
+
+
+class CompactSocialGraph:
+    """
+    SocialGraph'ın sütun tabanlı, salt okunur kompakt sürümü.
+
+    Düğümler (id, aktiflik, etkileşim) ve kenarlar (kaynak, hedef, ağırlık) tipli
+    dizilerde tutulur; komşuluk CSR biçimindedir. Node/Edge objeleri yerine
+    istek anında oluşturulan __slots__ görünümleri (NodeView, EdgeView) verilir.
+    Kenar başına yaklaşık 32 bayt yer kaplar; nesne grafında bu birkaç yüz bayttır.
+
+    nodes, edges, adjacency_list, get_edge_weight, neighbors_with_weights ve
+    freeze SocialGraph ile uyumlu olduğundan Algorithms doğrudan kullanılabilir.
+    Komşular id sırasıyla değil indeks sırasıyla (yükleme sırası) gezilir.
+    Grafı değiştirmek için SocialGraph kullanılmalıdır.
+    """
+
+    def __init__(self):
+        # Düğüm sütunları (indeks -> değer)
+        self.node_ids = array('q')
+        self.names = []
+        self.aktiflik = array('d')
+        self.etkilesim = array('d')
+        self.index = {}
+        # Kenar sütunları (kenar no -> değer); src < dst
+        self.edge_src = array('i')
+        self.edge_dst = array('i')
+        self.edge_weights = array('d')
+        # CSR komşuluk: her satır komşu indeksine göre sıralı
+        self.offsets = array('q', [0])
+        self.slot_neighbors = array('i')
+        self.slot_edges = array('i')
+
+        self.nodes = _NodeMapping(self)
+        self.edges = _EdgeList(self)
+        self.adjacency_list = _AdjacencyMapping(self)
+        self._frozen = None
+
+    def _append_node(self, node):
+        if node.id in self.index:
+            return
+        self.index[node.id] = len(self.node_ids)
+        self.node_ids.append(node.id)
+        self.names.append(node.name)
+        self.aktiflik.append(node.aktiflik)
+        self.etkilesim.append(node.etkilesim)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Mevcut bir SocialGraph'ı kompakt biçime dönüştür"""
+        compact = cls()
+        for node in graph.nodes.values():
+            compact._append_node(node)
+        compact._build_edges(graph.edge_index.keys())
+        return compact
+
+    @classmethod
+    def load_from_csv(cls, filename):
+        """
+        CSV'yi doğrudan kompakt biçime yükler (ara Node/Edge objeleri oluşmaz).
+
+        Returns:
+            CompactSocialGraph; hata durumunda SocialGraph.load_from_csv gibi hata mesajı (str)
+        """
+        compact = cls()
+        pending = array('q')
+        try:
+            with open(filename, mode='r', encoding='utf-8', buffering=1 << 20) as file:
+                for nid, node, komsular in read_csv_records(file):
+                    if node is not None:
+                        compact._append_node(node)
+                    for neighbor_id in komsular:
+                        pending.append(nid)
+                        pending.append(neighbor_id)
+            compact._build_edges(zip(pending[::2], pending[1::2]))
+            return compact
+        except FileNotFoundError:
+            return "Dosya bulunamadı!"
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def _build_edges(self, pairs):
+        """id çiftlerinden tekrarsız kenar sütunlarını, CSR'ı ve ağırlıkları kur"""
+        index = self.index
+        n = len(self.node_ids)
+
+        # Her yönsüz kenar lo * n + hi olarak tek tam sayıya paketlenir
+        keys = array('q')
+        for id1, id2 in pairs:
+            i, j = index.get(id1), index.get(id2)
+            if i is None or j is None or i == j:
+                continue
+            keys.append(i * n + j if i < j else j * n + i)
+
+        if np is not None:
+            unique = np.unique(np.asarray(memoryview(keys)))
+            self.edge_src = array('i', (unique // n).astype(np.int32).tobytes())
+            self.edge_dst = array('i', (unique % n).astype(np.int32).tobytes())
+        else:
+            unique = sorted(set(keys))
+            self.edge_src = array('i', (key // n for key in unique))
+            self.edge_dst = array('i', (key % n for key in unique))
+        del keys, unique
+
+        # Dereceler -> satır başlangıçları
+        degrees = array('q', [0]) * n
+        for i in self.edge_src:
+            degrees[i] += 1
+        for j in self.edge_dst:
+            degrees[j] += 1
+        offsets = array('q', [0]) * (n + 1)
+        for i in range(n):
+            offsets[i + 1] = offsets[i] + degrees[i]
+
+        # Kenarlar (lo, hi) sırasında olduğundan her satır komşu indeksine göre sıralı dolar
+        slots = offsets[n]
+        slot_neighbors = array('i', [0]) * slots
+        slot_edges = array('i', [0]) * slots
+        cursor = offsets[:n]
+        for e, (i, j) in enumerate(zip(self.edge_src, self.edge_dst)):
+            pos = cursor[i]
+            slot_neighbors[pos] = j
+            slot_edges[pos] = e
+            cursor[i] = pos + 1
+            pos = cursor[j]
+            slot_neighbors[pos] = i
+            slot_edges[pos] = e
+            cursor[j] = pos + 1
+
+        self.offsets = offsets
+        self.slot_neighbors = slot_neighbors
+        self.slot_edges = slot_edges
+        self.edge_weights = weights_from_node_arrays(self.aktiflik, self.etkilesim, degrees,
+                                                     self.edge_src, self.edge_dst)
+        self._frozen = None
+
+    def degree_at(self, index):
+        return self.offsets[index + 1] - self.offsets[index]
+
+    def find_slot(self, index, neighbor_index):
+        """index satırında neighbor_index'in CSR konumu (yoksa -1) - O(log derece)"""
+        if neighbor_index < 0:
+            return -1
+        lo, hi = self.offsets[index], self.offsets[index + 1]
+        pos = bisect_left(self.slot_neighbors, neighbor_index, lo, hi)
+        if pos < hi and self.slot_neighbors[pos] == neighbor_index:
+            return pos
+        return -1
+
+    def get_edge(self, id1, id2):
+        i, j = self.index.get(id1), self.index.get(id2)
+        if i is None or j is None:
+            return None
+        pos = self.find_slot(i, j)
+        return EdgeView(self, self.slot_edges[pos]) if pos >= 0 else None
+
+    def get_edge_weight(self, id1, id2):
+        edge = self.get_edge(id1, id2)
+        return edge.weight if edge is not None else float('inf')
+
+    def neighbors_with_weights(self, node_id):
+        i = self.index.get(node_id)
+        if i is None:
+            return
+        ids, neighbors, slot_edges, weights = self.node_ids, self.slot_neighbors, self.slot_edges, self.edge_weights
+        for pos in range(self.offsets[i], self.offsets[i + 1]):
+            yield ids[neighbors[pos]], weights[slot_edges[pos]]
+
+    def freeze(self):
+        """CSRGraph görüntüsü; sütunlar kopyalanmadan paylaşılır"""
+        if self._frozen is None:
+            weights = self.edge_weights
+            slot_weights = array('d', (weights[e] for e in self.slot_edges))
+            self._frozen = CSRGraph(self.node_ids, self.offsets, self.slot_neighbors, slot_weights,
+                                    self.aktiflik, self.etkilesim, self.names)
+        return self._frozen
+
+    def __repr__(self):
+        return f"CompactSocialGraph(nodes={len(self.node_ids)}, edges={len(self.edge_src)})"
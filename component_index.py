@@ -0,0 +1,75 @@
+class ComponentIndex:
+    """
+    Bağlı bileşenler için ayrık küme (union-find) indeksi.
+    Rank ile birleştirme ve yol sıkıştırma sayesinde düğüm/kenar ekleme ve
+    bileşen sorguları neredeyse O(1)'dir. Union-find silmeyi desteklemediği
+    için kenar/düğüm silindiğinde indeks "kirli" işaretlenir ve bir sonraki
+    sorgudan önce komşuluk listesinden yeniden kurulur.
+    """
+
+    def __init__(self):
+        self.parent = {}
+        self.rank = {}
+        self.size = {}        # yalnızca kökler için: bileşen büyüklüğü
+        self.count = 0        # bileşen sayısı
+        self.largest_size = 0
+        self.dirty = False
+
+    def add(self, node_id):
+        if node_id in self.parent:
+            return
+        self.parent[node_id] = node_id
+        self.rank[node_id] = 0
+        self.size[node_id] = 1
+        self.count += 1
+        if self.largest_size < 1:
+            self.largest_size = 1
+
+    def find(self, node_id):
+        """Bileşen temsilcisi (kök); yol yarılama ile sıkıştırılır"""
+        parent = self.parent
+        while parent[node_id] != node_id:
+            parent[node_id] = parent[parent[node_id]]
+            node_id = parent[node_id]
+        return node_id
+
+    def union(self, id1, id2):
+        root1, root2 = self.find(id1), self.find(id2)
+        if root1 == root2:
+            return root1
+        if self.rank[root1] < self.rank[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        if self.rank[root1] == self.rank[root2]:
+            self.rank[root1] += 1
+        self.size[root1] += self.size.pop(root2)
+        self.count -= 1
+        if self.size[root1] > self.largest_size:
+            self.largest_size = self.size[root1]
+        return root1
+
+    def same_component(self, id1, id2):
+        return self.find(id1) == self.find(id2)
+
+    def component_size(self, node_id):
+        return self.size[self.find(node_id)]
+
+    def groups(self):
+        """Bileşenlerin üye listeleri (ilk üyenin eklenme sırasına göre)"""
+        members = {}
+        for node_id in self.parent:
+            members.setdefault(self.find(node_id), []).append(node_id)
+        return list(members.values())
+
+    def invalidate(self):
+        self.dirty = True
+
+    def rebuild(self, adjacency_list):
+        """İndeksi komşuluk listesinden sıfırdan kur (O(V + E))"""
+        self.__init__()
+        for node_id in adjacency_list:
+            self.add(node_id)
+        for node_id, neighbors in adjacency_list.items():
+            for neighbor_id in neighbors:
+                if node_id < neighbor_id:
+                    self.union(node_id, neighbor_id)
@@ -0,0 +1,106 @@
+from array import array
+
+
+class CSRGraph:
+    """
+    SocialGraph'ın salt okunur, sıkıştırılmış satır (CSR - Compressed Sparse Row) görüntüsü.
+
+    Düğümler 0..n-1 arası yoğun indekslerle temsil edilir. i. düğümün komşuları
+    neighbors[offsets[i]:offsets[i+1]] aralığında, aynı kenarın ağırlığı da
+    weights dizisinde aynı konumda tutulur. Node/Edge objesi yerine bitişik tipli
+    diziler kullanıldığı için bellek kullanımı birkaç kat düşer ve gezinti
+    önbellek dostu olur.
+
+    Görüntü oluşturulduktan sonra değiştirilmemelidir; graf değişirse
+    SocialGraph.freeze() ile yeni bir görüntü alınmalıdır.
+    """
+
+    def __init__(self, ids, offsets, neighbors, weights, aktiflik, etkilesim, names=None):
+        """
+        Args:
+            ids: indeks -> düğüm id dizisi
+            offsets: n+1 uzunluklu satır başlangıçları
+            neighbors: komşu indeksleri (her yönsüz kenar iki kez)
+            weights: neighbors ile hizalı kenar ağırlıkları
+            aktiflik: indeks -> aktiflik
+            etkilesim: indeks -> etkileşim
+            names: indeks -> düğüm adı (opsiyonel)
+
+        Diziler array.array ya da (mmap üzerindeki) memoryview olabilir.
+        """
+        self.ids = ids
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.weights = weights
+        self.aktiflik = aktiflik
+        self.etkilesim = etkilesim
+        self.names = names
+        self.source_path = None  # binary snapshot'tan açıldıysa dosya yolu
+        self._index = None       # id -> indeks; ilk kullanımda kurulur
+
+    @property
+    def index(self):
+        """
+        Düğüm id -> indeks sözlüğü. Her düğüm için bir kayıt gerektirdiğinden
+        ilk erişimde kurulur; yalnızca indeks üzerinden çalışan analizler
+        (ve snapshot açılışı) bu maliyeti hiç ödemez.
+        """
+        if self._index is None:
+            self._index = {node_id: i for i, node_id in enumerate(self.ids)}
+        return self._index
+
+    def __getstate__(self):
+        # Snapshot'tan açılan görüntü için yalnızca dosya yolu gönderilir, alıcı
+        # dosyayı kendisi eşler. Aksi halde yalnızca diziler taşınır, id->indeks
+        # sözlüğü gerekirse karşı tarafta yeniden kurulur.
+        if self.source_path is not None:
+            return {'source_path': self.source_path}
+        state = self.__dict__.copy()
+        state['_index'] = None
+        return state
+
+    def __setstate__(self, state):
+        if set(state) == {'source_path'}:
+            from snapshot import load_snapshot
+            state = load_snapshot(state['source_path']).__dict__
+        self.__dict__.update(state)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """SocialGraph'tan CSR görüntüsü oluştur (O(V + E))"""
+        index = {node_id: i for i, node_id in enumerate(graph.nodes)}
+
+        ids = array('q', graph.nodes.keys())
+        aktiflik = array('d', (node.aktiflik for node in graph.nodes.values()))
+        etkilesim = array('d', (node.etkilesim for node in graph.nodes.values()))
+        names = [node.name for node in graph.nodes.values()]
+
+        offsets = array('q', [0])
+        neighbors = array('i')
+        weights = array('d')
+        for node_id in graph.nodes:
+            for neighbor_id, edge in graph.adjacency_list.get(node_id, {}).items():
+                neighbors.append(index[neighbor_id])
+                weights.append(edge.weight)
+            offsets.append(len(neighbors))
+
+        return cls(ids, offsets, neighbors, weights, aktiflik, etkilesim, names)
+
+    @property
+    def num_nodes(self):
+        return len(self.ids)
+
+    @property
+    def num_edges(self):
+        """Yönsüz kenar sayısı"""
+        return len(self.neighbors) // 2
+
+    def degree(self, i):
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def neighbor_range(self, i):
+        """i. düğümün komşularının neighbors/weights içindeki konum aralığı"""
+        return range(self.offsets[i], self.offsets[i + 1])
+
+    def __repr__(self):
+        return f"CSRGraph(nodes={self.num_nodes}, edges={self.num_edges})"
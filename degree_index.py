@@ -0,0 +1,85 @@
+import heapq
+from bisect import bisect_left, insort
+
+
+class DegreeIndex:
+    """
+    Düğüm derecelerini kovalar halinde tutan indeks: derece -> düğüm kümesi.
+    SocialGraph kenar ekleyip sildikçe güncellenir; böylece en yüksek dereceli
+    k düğüm tüm grafı taramadan, en üst kovalardan okunarak bulunur.
+    Dolu kovaların dereceleri ayrıca sıralı bir listede tutulur; boş
+    dereceler hiç gezilmez.
+    """
+
+    def __init__(self):
+        self.buckets = {}     # derece -> {node_id: None}
+        self.degree_of = {}   # node_id -> derece
+        self.degrees = []     # dolu kovaların dereceleri, artan sırada
+
+    def __len__(self):
+        return len(self.degree_of)
+
+    @property
+    def max_degree(self):
+        return self.degrees[-1] if self.degrees else 0
+
+    def _insert(self, node_id, degree):
+        bucket = self.buckets.get(degree)
+        if bucket is None:
+            bucket = self.buckets[degree] = {}
+            insort(self.degrees, degree)
+        bucket[node_id] = None
+        self.degree_of[node_id] = degree
+
+    def _discard(self, node_id, degree):
+        bucket = self.buckets[degree]
+        del bucket[node_id]
+        if not bucket:
+            del self.buckets[degree]
+            del self.degrees[bisect_left(self.degrees, degree)]
+
+    def _move(self, node_id, old_degree, new_degree):
+        self._discard(node_id, old_degree)
+        self._insert(node_id, new_degree)
+
+    def rebuild(self, adjacency_list):
+        """İndeksi komşuluk listesinden sıfırdan kur (toplu yükleme sonrası)"""
+        self.__init__()
+        for node_id, neighbors in adjacency_list.items():
+            self.add(node_id, len(neighbors))
+
+    def add(self, node_id, degree=0):
+        if node_id in self.degree_of:
+            return
+        self._insert(node_id, degree)
+
+    def remove(self, node_id):
+        degree = self.degree_of.pop(node_id, None)
+        if degree is None:
+            return
+        self._discard(node_id, degree)
+
+    def increment(self, node_id):
+        degree = self.degree_of[node_id]
+        self._move(node_id, degree, degree + 1)
+
+    def decrement(self, node_id):
+        degree = self.degree_of[node_id]
+        if degree > 0:
+            self._move(node_id, degree, degree - 1)
+
+    def top_k(self, k=5):
+        """
+        En yüksek dereceli k düğüm, (node_id, derece) listesi olarak.
+        Aynı derecedeki düğümlerden küçük id'li olanlar önce gelir.
+        Yalnızca en üstteki dolu kovalar gezilir.
+        """
+        result = []
+        for degree in reversed(self.degrees):
+            if len(result) >= k:
+                break
+            bucket = self.buckets[degree]
+            remaining = k - len(result)
+            chosen = sorted(bucket) if len(bucket) <= remaining else heapq.nsmallest(remaining, bucket)
+            result.extend((node_id, degree) for node_id in chosen)
+        return result
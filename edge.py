@@ -4,9 +4,11 @@ class Edge:
     """
     İki düğüm arasındaki bağlantıyı temsil eden sınıf.
     Ağırlık, düğümlerin özellikleri ve bağlantı sayılarına göre dinamik hesaplanır.
+    __slots__ ile örnek başına __dict__ tutulmaz (büyük graflarda bellek tasarrufu).
     """
+    __slots__ = ('source', 'target', 'source_baglanti', 'target_baglanti', '_weight', 'weight_overridden')
     
-    def __init__(self, source_node, target_node, source_baglanti=0, target_baglanti=0):
+    def __init__(self, source_node, target_node, source_baglanti=0, target_baglanti=0, weight=None):
         """
         Edge oluşturucu
         
@@ -15,12 +17,33 @@ class Edge:
             target_node: Hedef düğüm (Node objesi)
             source_baglanti: Kaynak düğümün bağlantı sayısı (opsiyonel)
             target_baglanti: Hedef düğümün bağlantı sayısı (opsiyonel)
+            weight: Verilirse formül hesaplanmaz. Verilmezse ağırlık ilk
+                    okunduğunda (veya weight_engine ile toplu olarak) hesaplanır.
         """
         self.source = source_node
         self.target = target_node
         self.source_baglanti = source_baglanti
         self.target_baglanti = target_baglanti
-        self.weight = self.calculate_weight()
+        self._weight = weight  # None: henüz hesaplanmadı veya kirli
+        self.weight_overridden = False  # True: ağırlık elle verildi, formülle ezilmez
+
+    @property
+    def weight(self):
+        """Kenar ağırlığı; gerekiyorsa ilk erişimde hesaplanır"""
+        if self._weight is None:
+            self._weight = self.calculate_weight()
+        return self._weight
+
+    @weight.setter
+    def weight(self, value):
+        """Elle ağırlık ataması; bağlantı sayıları değişse de korunur"""
+        self._weight = value
+        self.weight_overridden = True
+
+    def invalidate_weight(self):
+        """Ağırlığı geçersiz kıl; bir sonraki erişimde yeniden hesaplanır"""
+        if not self.weight_overridden:
+            self._weight = None
 
     def calculate_weight(self):
         """
@@ -66,7 +89,7 @@ class Edge:
         if target_baglanti is not None:
             self.target_baglanti = target_baglanti
         
-        self.weight = self.calculate_weight()
+        self.invalidate_weight()
     
     def __repr__(self):
         return f"Edge({self.source.id} -> {self.target.id}, weight={self.weight:.2f})"
\ No newline at end of file
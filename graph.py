@@ -1,132 +1,434 @@
-import json
 import csv
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
 from node import Node
 from edge import Edge
+from weight_engine import compute_weights
+from json_stream import write_graph_json, iter_graph_json
+from csr_graph import CSRGraph
+from snapshot import load_snapshot
+from degree_index import DegreeIndex
+from component_index import ComponentIndex
+from path_cache import ShortestPathCache
+
+def read_csv_records(file):
+    """
+    DugumId,Ad,Aktiflik,Etkilesim,BaglantiSayisi,Komsular biçimindeki açık bir
+    CSV dosyasını satır satır ayrıştırır (BaglantiSayisi okunmaz, dinamik hesaplanır).
+
+    Yields:
+        (düğüm_id, Node veya None, komşu_id listesi) - özellikleri bozuk
+        satırlarda Node None olur; DugumId okunamayan satırlar atlanır.
+    """
+    for row in csv.DictReader(file):
+        try:
+            nid = int(row['DugumId'])
+        except (ValueError, KeyError) as e:
+            print(f"Düğüm oluşturma hatası: {e}")
+            continue
+
+        try:
+            # Node artık 4 parametre alıyor (baglanti_sayisi yok)
+            node = Node(nid, row['Ad'], row['Aktiflik'], row['Etkilesim'])
+        except (ValueError, KeyError) as e:
+            print(f"Düğüm oluşturma hatası: {e}")
+            node = None
+
+        komsular_str = (row.get('Komsular') or '').replace('"', '')
+        komsular = [int(k) for k in map(str.strip, komsular_str.split(',')) if k.isdigit()]
+        yield nid, node, komsular
+
+
+def parse_csv_shard(filename):
+    """
+    Tek bir CSV parçasını (shard) ayrıştırır; işçi süreçte çalışacak şekilde
+    sonuç, Node objeleri yerine tipli dizilerle döndürülür. Kenarlar
+    (küçük_id, büyük_id) olarak normalleştirilir ve parça içindeki tekrarlar
+    burada ayıklanır.
+
+    Returns:
+        (ids, names, aktiflik, etkilesim, pairs) - pairs düz array('q'):
+        id1, id2, id1, id2, ... ; dosya yoksa FileNotFoundError fırlatır
+    """
+    ids, aktiflik, etkilesim = array('q'), array('d'), array('d')
+    names = []
+    edges = {}
+    with open(filename, mode='r', encoding='utf-8', buffering=1 << 20) as file:
+        for nid, node, komsular in read_csv_records(file):
+            if node is not None:
+                ids.append(node.id)
+                names.append(node.name)
+                aktiflik.append(node.aktiflik)
+                etkilesim.append(node.etkilesim)
+            for neighbor_id in komsular:
+                if nid != neighbor_id:
+                    edges[(nid, neighbor_id) if nid < neighbor_id else (neighbor_id, nid)] = None
+
+    pairs = array('q')
+    for id1, id2 in edges:
+        pairs.append(id1)
+        pairs.append(id2)
+    return ids, names, aktiflik, etkilesim, pairs
+
 
 class SocialGraph:
     def __init__(self):
+        self.journal = None  # bağlıysa her mutasyon ChangeJournal'a eklenir
+        # Her mutasyonda artan sürüm; önbellekler ve ön hesaplamalar bununla doğrulanır
+        self.version = 0
+        # Yalnızca topoloji ya da kenar ağırlıkları değişince artan sürüm; uzaklığa
+        # dayalı ön hesaplamalar (LandmarkIndex) isim gibi değişikliklerde korunur
+        self.distance_version = 0
+        self.path_cache = ShortestPathCache()
+        self.clear()
+
+    def clear(self):
+        """Grafı ve tüm yardımcı indeksleri boşalt"""
+        self.version += 1
+        self.distance_version += 1
+        self.path_cache.clear()
         self.nodes = {} 
-        self.edges = [] 
+        self.edge_index = {}  # (küçük_id, büyük_id) -> Edge
+        # id -> {komsu_id: Edge}; dict sıralı küme gibi kullanılır:
+        # O(1) üyelik/silme ve eklenme sırasıyla deterministik gezinti
         self.adjacency_list = {} 
+        self.degree_index = DegreeIndex()  # derece kovaları (top-k sorguları için)
+        self.component_index = ComponentIndex()  # union-find bağlı bileşenler
+        # Bir ucunun derecesi/özelliği değiştiği için ağırlığı yeniden hesaplanacak kenarlar
+        self.dirty_edges = set()
+
+    @property
+    def edges(self):
+        """Tüm kenarlar (eklenme sırasıyla). Kaynak veri edge_index'tir."""
+        return self.edge_index.values()
+
+    def attach_journal(self, journal):
+        """Sonraki mutasyonları verilen ChangeJournal'a yaz (None ile ayrılır)"""
+        self.journal = journal
+
+    @contextmanager
+    def journal_paused(self):
+        """Toplu yükleme ve günlük tekrarında değişikliklerin günlüğe yazılmasını durdur"""
+        journal, self.journal = self.journal, None
+        try:
+            yield
+        finally:
+            self.journal = journal
+
+    def _changed(self, touched=(), removed_edges=(), removed_nodes=(), distances=True):
+        """
+        Sürümü artır ve yol önbelleğine yalnızca etkilenen ağaçları düşürmesini bildir.
+        distances=False: değişiklik hiçbir kenarın varlığını ya da ağırlığını etkilemedi.
+        """
+        self.version += 1
+        if distances:
+            self.distance_version += 1
+        self.path_cache.on_change(self, touched, removed_edges, removed_nodes)
+
+    def _log(self, op, **fields):
+        if self.journal is not None:
+            self.journal.append(op, **fields)
+
+    @staticmethod
+    def _edge_key(id1, id2):
+        """Yönsüz kenar için sıra bağımsız anahtar"""
+        return (id1, id2) if id1 <= id2 else (id2, id1)
+
+    def _mark_dirty(self, node_id):
+        """
+        Düğümün derecesi veya özellikleri değişti: yalnızca ona bağlı kenarların
+        bağlantı sayısını güncelle ve ağırlıklarını kirli işaretle. Ağırlıklar
+        ilk erişimde ya da flush_weights ile toplu olarak hesaplanır.
+        """
+        neighbors = self.adjacency_list[node_id]
+        degree = len(neighbors)
+        for edge in neighbors.values():
+            if edge.source.id == node_id:
+                edge.source_baglanti = degree
+            else:
+                edge.target_baglanti = degree
+            edge.invalidate_weight()
+            self.dirty_edges.add(edge)
+
+    def flush_weights(self):
+        """Kirli kenarların ağırlıklarını tek vektörize geçişte hesapla"""
+        if self.dirty_edges:
+            compute_weights(self.dirty_edges)
+            self.dirty_edges.clear()
 
     def add_node(self, node):
         if node.id not in self.nodes:
             self.nodes[node.id] = node
-            self.adjacency_list[node.id] = []
+            self.adjacency_list[node.id] = {}
+            self.degree_index.add(node.id)
+            self.component_index.add(node.id)
+            self._changed(distances=False)  # bağlantısız düğüm uzaklıkları değiştirmez
+            self._log("add_node", **node.to_dict())
 
     def remove_node(self, node_id):
         if node_id in self.nodes:
             del self.nodes[node_id]
-            del self.adjacency_list[node_id]
-            # Bu düğüme bağlı kenarları temizle
-            self.edges = [e for e in self.edges if e.source.id != node_id and e.target.id != node_id]
-            # Komşuluk listelerinden temizle
-            for nid in self.adjacency_list:
-                if node_id in self.adjacency_list[nid]:
-                    self.adjacency_list[nid].remove(node_id)
+            # Yalnızca gerçek komşulara dokun: kenarları ve karşı taraftaki kayıtları temizle
+            neighbors = self.adjacency_list.pop(node_id, {})
+            for neighbor_id, edge in neighbors.items():
+                self.edge_index.pop(self._edge_key(node_id, neighbor_id), None)
+                self.dirty_edges.discard(edge)
+                self.adjacency_list[neighbor_id].pop(node_id, None)
+                self.degree_index.decrement(neighbor_id)
+                self._mark_dirty(neighbor_id)
+            self.degree_index.remove(node_id)
+            self.component_index.invalidate()
+            self._changed(touched=neighbors, removed_nodes=(node_id,), distances=bool(neighbors))
+            self._log("remove_node", id=node_id)
 
     def update_node(self, node_id, new_name, new_aktiflik, new_etkilesim=None):
         """Düğüm güncelleme - etkilesim parametresi eklendi"""
         if node_id in self.nodes:
             node = self.nodes[node_id]
+            old = (node.aktiflik, node.etkilesim)
             node.name = new_name
             node.aktiflik = float(new_aktiflik)
             if new_etkilesim is not None:
                 node.etkilesim = float(new_etkilesim)
-            # Ağırlıklar değişeceği için kenarları güncelle
-            for edge in self.edges:
-                if edge.source.id == node_id or edge.target.id == node_id:
-                    edge.weight = edge.calculate_weight()
+            # Yalnızca isim değiştiyse ya da düğümün kenarı yoksa hiçbir ağırlık değişmez
+            reweighted = (node.aktiflik, node.etkilesim) != old and bool(self.adjacency_list.get(node_id))
+            self._log("update_node", id=node_id, name=node.name, aktiflik=node.aktiflik,
+                      etkilesim=node.etkilesim)
+            # Ağırlıklar değişeceği için yalnızca bu düğüme bağlı kenarlar kirlenir
+            if reweighted:
+                self._mark_dirty(node_id)
+            self._changed(touched=(node_id,), distances=reweighted)
 
     def add_edge(self, id1, id2):
         if id1 in self.nodes and id2 in self.nodes:
             if id1 == id2: return  # Self-loop engelle
             if id2 in self.adjacency_list[id1]: return  # Duplicate engelle
 
-            n1 = self.nodes[id1]
-            n2 = self.nodes[id2]
+            new_edge = Edge(self.nodes[id1], self.nodes[id2])
+            self.edge_index[self._edge_key(id1, id2)] = new_edge
             
-            # ✅ Bağlantı sayılarını hesapla (edge eklenmeden ÖNCE)
-            baglanti_1 = len(self.adjacency_list.get(id1, []))
-            baglanti_2 = len(self.adjacency_list.get(id2, []))
-            
-            # Edge'i bağlantı sayılarıyla oluştur
-            new_edge = Edge(n1, n2, baglanti_1, baglanti_2)
-            self.edges.append(new_edge)
-            
-            self.adjacency_list[id1].append(id2)
-            self.adjacency_list[id2].append(id1)
+            self.adjacency_list[id1][id2] = new_edge
+            self.adjacency_list[id2][id1] = new_edge
+            self.degree_index.increment(id1)
+            self.degree_index.increment(id2)
+            self.component_index.union(id1, id2)
+
+            # İki ucun derecesi değişti: yeni kenar dahil bağlı kenarlar kirlenir
+            self._mark_dirty(id1)
+            self._mark_dirty(id2)
+            self._changed(touched=(id1, id2))
+            self._log("add_edge", source=id1, target=id2)
 
     def remove_edge(self, id1, id2):
         """Bağlantı silme"""
-        self.edges = [e for e in self.edges if not (
-            (e.source.id == id1 and e.target.id == id2) or 
-            (e.source.id == id2 and e.target.id == id1)
-        )]
-        if id1 in self.adjacency_list and id2 in self.adjacency_list[id1]:
-            self.adjacency_list[id1].remove(id2)
-        if id2 in self.adjacency_list and id1 in self.adjacency_list[id2]:
-            self.adjacency_list[id2].remove(id1)
+        edge = self.edge_index.pop(self._edge_key(id1, id2), None)
+        if edge is None:
+            return
+        self.dirty_edges.discard(edge)
+        self.adjacency_list[id1].pop(id2, None)
+        self.adjacency_list[id2].pop(id1, None)
+        self.degree_index.decrement(id1)
+        self.degree_index.decrement(id2)
+        self.component_index.invalidate()
+        self._mark_dirty(id1)
+        self._mark_dirty(id2)
+        self._changed(touched=(id1, id2), removed_edges=((id1, id2),))
+        self._log("remove_edge", source=id1, target=id2)
+
+    def set_edge_weight(self, id1, id2, weight):
+        """Kenara elle ağırlık ata (formül yerine bu değer kullanılır)"""
+        edge = self.get_edge(id1, id2)
+        if edge is None:
+            return False
+        edge.weight = float(weight)
+        self.dirty_edges.discard(edge)
+        self._changed(touched=(id1, id2))
+        self._log("set_weight", source=id1, target=id2, weight=edge.weight)
+        return True
+
+    def get_edge(self, id1, id2):
+        """İki düğüm arasındaki Edge objesi (yoksa None) - O(1)"""
+        return self.edge_index.get(self._edge_key(id1, id2))
 
     def get_edge_weight(self, id1, id2):
-        for edge in self.edges:
-            if (edge.source.id == id1 and edge.target.id == id2) or \
-               (edge.source.id == id2 and edge.target.id == id1):
-                return edge.weight
-        return float('inf')
+        self.flush_weights()
+        edge = self.edge_index.get(self._edge_key(id1, id2))
+        if edge is None:
+            return float('inf')
+        return edge.weight
+
+    def neighbors_with_weights(self, node_id):
+        """
+        Düğümün komşularını kenar ağırlıklarıyla birlikte üretir.
+        Yol bulma algoritmaları her komşu için ayrı arama yapmak yerine bunu kullanır.
+
+        Yields:
+            (komsu_id, agirlik) ikilileri
+        """
+        self.flush_weights()
+        for neighbor_id, edge in self.adjacency_list.get(node_id, {}).items():
+            yield neighbor_id, edge.weight
+
+    def components(self):
+        """
+        Güncel bağlı bileşen indeksi. Ekleme işlemleri indeksi anında günceller;
+        silme sonrası ise indeks burada, ilk sorguda yeniden kurulur.
+
+        Örnek: graph.components().count, graph.components().same_component(a, b)
+        """
+        if self.component_index.dirty:
+            self.component_index.rebuild(self.adjacency_list)
+        return self.component_index
+
+    def freeze(self):
+        """
+        Salt okunur analizler için sıkıştırılmış CSR görüntüsü üretir.
+        Görüntü o anki ağırlıkları kopyalar; graf değişirse tekrar çağrılmalıdır.
+        """
+        self.flush_weights()
+        return CSRGraph.from_graph(self)
+
+    def add_edges_bulk(self, pairs):
+        """
+        Çok sayıda kenarı tek seferde ekler. add_edge ile aynı kurallar geçerlidir
+        (self-loop, tekrar ve bilinmeyen düğümler atlanır) ancak derecesi değişen
+        düğümlerin kenarları ve derece indeksi kenar başına değil, en sonda
+        tek geçişte güncellenir.
+
+        Args:
+            pairs: (id1, id2) ikililerinin yinelenebilir dizisi
+
+        Returns:
+            int: eklenen kenar sayısı
+        """
+        nodes = self.nodes
+        adjacency = self.adjacency_list
+        edge_index = self.edge_index
+        union = self.component_index.union
+        touched = set()
+        added = 0
+
+        for id1, id2 in pairs:
+            if id1 == id2 or id1 not in nodes or id2 not in nodes:
+                continue
+            adj1 = adjacency[id1]
+            if id2 in adj1:
+                continue
+            edge = Edge(nodes[id1], nodes[id2])
+            adj1[id2] = edge
+            adjacency[id2][id1] = edge
+            edge_index[self._edge_key(id1, id2)] = edge
+            union(id1, id2)
+            touched.add(id1)
+            touched.add(id2)
+            added += 1
+            if self.journal is not None:
+                self.journal.append("add_edge", source=id1, target=id2)
+
+        for node_id in touched:
+            self._mark_dirty(node_id)
+        self.flush_weights()
+        self.degree_index.rebuild(adjacency)
+        if added:
+            self.version += 1
+            self.distance_version += 1
+            self.path_cache.clear()
+        return added
+
+    def recompute_weights(self):
+        """
+        Tüm kenar ağırlıklarını tek bir vektörize geçişte yeniden hesaplar
+        (ör. düğüm özellikleri update_node dışında toplu değiştirildiğinde).
+        """
+        self.dirty_edges.clear()
+        self.version += 1
+        self.distance_version += 1
+        self.path_cache.clear()
+        return compute_weights(self.edge_index.values())
 
     def load_from_csv(self, filename):
-        """CSV'den veri yükleme - BaglantiSayisi artık opsiyonel"""
-        self.nodes = {}
-        self.edges = []
-        self.adjacency_list = {}
+        """
+        CSV'den veri yükleme - BaglantiSayisi artık opsiyonel.
+        Dosya satır satır tek geçişte okunur; henüz görülmemiş düğümlere
+        verilen komşuluklar kompakt bir tamponda bekletilir ve dosya sonunda
+        add_edges_bulk ile topluca eklenir.
+        """
+        self.clear()
+        pending = array('q')  # src, komsu, src, komsu, ...
         
         try:
-            with open(filename, mode='r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                rows = list(reader)
-                
-                # Önce tüm düğümleri oluştur
-                for row in rows:
-                    try:
-                        nid = int(row['DugumId'])
-                        # Node artık 4 parametre alıyor (baglanti_sayisi yok)
-                        new_node = Node(
-                            nid, 
-                            row['Ad'], 
-                            row['Aktiflik'], 
-                            row['Etkilesim']
-                        )
-                        self.add_node(new_node)
-                    except (ValueError, KeyError) as e:
-                        print(f"Düğüm oluşturma hatası: {e}")
-                        continue
-                
-                # Sonra kenarları ekle
-                for row in rows:
-                    try:
-                        src_id = int(row['DugumId'])
-                        komsular_str = row.get('Komsular', '').replace('"', '').strip()
-                        
-                        if komsular_str:
-                            komsular = komsular_str.split(',')
-                            for k in komsular:
-                                k = k.strip()
-                                if k and k.isdigit():
-                                    neighbor_id = int(k)
-                                    if neighbor_id in self.nodes:
-                                        self.add_edge(src_id, neighbor_id)
-                    except (ValueError, KeyError) as e:
-                        print(f"Kenar ekleme hatası: {e}")
-                        continue
-                        
-            return True
+            with self.journal_paused():  # yükleme yeni taban oluşturur, günlüğe yazılmaz
+                with open(filename, mode='r', encoding='utf-8', buffering=1 << 20) as file:
+                    for nid, node, komsular in read_csv_records(file):
+                        if node is not None:
+                            self.add_node(node)
+                        for neighbor_id in komsular:
+                            pending.append(nid)
+                            pending.append(neighbor_id)
+
+                self.add_edges_bulk(zip(pending[::2], pending[1::2]))
+                return True
             
         except FileNotFoundError:
             return "Dosya bulunamadı!"
         except Exception as e:
             return f"Hata: {str(e)}"
 
+    def load_from_csv_shards(self, filenames, workers=None):
+        """
+        Aynı formattaki birden çok CSV parçasını süreç havuzunda paralel
+        ayrıştırıp tek grafta birleştirir. Bir düğüm birden çok parçada varsa
+        ilk parçadaki kaydı kullanılır; parçalar arası tekrar eden kenarlar
+        add_edges_bulk tarafından tek kenara indirilir. Bir parçadaki komşu,
+        başka bir parçada tanımlı düğümü gösterebilir.
+
+        Args:
+            filenames: CSV dosya yolları (birleştirme bu sırayla yapılır)
+            workers: süreç sayısı; None ise min(dosya sayısı, CPU sayısı),
+                1 ise parçalar bu süreçte sırayla okunur
+
+        Returns:
+            True; hata durumunda load_from_csv gibi hata mesajı (str)
+        """
+        filenames = list(filenames)
+        self.clear()
+        if workers is None:
+            workers = min(len(filenames), os.cpu_count() or 1)
+
+        try:
+            if workers <= 1 or len(filenames) <= 1:
+                shards = map(parse_csv_shard, filenames)
+                executor = None
+            else:
+                executor = ProcessPoolExecutor(max_workers=workers)
+                shards = executor.map(parse_csv_shard, filenames)
+
+            try:
+                with self.journal_paused():  # birleştirme yeni taban oluşturur, günlüğe yazılmaz
+                    # Parçalar tamamlandıkça (sırayla) düğümler eklenir; kenarlar tüm
+                    # düğümler bilinene kadar bekletilir
+                    pending = []
+                    for ids, names, aktiflik, etkilesim, pairs in shards:
+                        for node_fields in zip(ids, names, aktiflik, etkilesim):
+                            if node_fields[0] not in self.nodes:
+                                self.add_node(Node(*node_fields))
+                        pending.append(pairs)
+
+                    self.add_edges_bulk(chain.from_iterable(
+                        zip(pairs[::2], pairs[1::2]) for pairs in pending))
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            return True
+
+        except FileNotFoundError as e:
+            return f"Dosya bulunamadı! ({e.filename})"
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
     def save_to_csv(self, filename):
         """
         ✅ DÜZELTİLMİŞ: CSV'ye kaydetme - BaglantiSayisi dinamik hesaplanıyor
@@ -144,7 +446,7 @@ class SocialGraph:
                     node = self.nodes[node_id]
                     
                     # Komşuları al
-                    komsular = self.adjacency_list.get(node_id, [])
+                    komsular = self.adjacency_list.get(node_id, {})
                     
                     # ✅ Bağlantı sayısını dinamik hesapla
                     baglanti_sayisi = len(komsular)
@@ -171,17 +473,95 @@ class SocialGraph:
             print(f"CSV kaydetme hatası: {str(e)}")
             return False
 
-    def save_to_json(self, filename="graph_data.json"):
-        """JSON'a kaydetme"""
-        data = {
-            "nodes": [n.to_dict() for n in self.nodes.values()],
-            "edges": [
-                {
-                    "source": e.source.id, 
-                    "target": e.target.id, 
-                    "weight": e.weight
-                } for e in self.edges
-            ]
-        }
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
\ No newline at end of file
+    def save_to_json(self, filename="graph_data.json", compact=False, ndjson=False):
+        """
+        JSON'a kaydetme. Düğüm ve kenarlar gezildikçe dosyaya yazılır; tüm
+        graf tek bir sözlükte toplanmaz.
+
+        Args:
+            compact: True ise girintisiz tek satır belge
+            ndjson: True ise satır başına bir kayıt ({"type": "node"|"edge", ...})
+        """
+        self.flush_weights()
+        edges = (
+            {"source": e.source.id, "target": e.target.id, "weight": e.weight}
+            for e in self.edges
+        )
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            write_graph_json(f, (n.to_dict() for n in self.nodes.values()), edges,
+                             indent=None if compact else 4, ndjson=ndjson)
+        return True
+
+    def load_from_json(self, filename="graph_data.json", keep_weights=False):
+        """
+        save_to_json çıktısını (belge, compact ya da NDJSON) kayıt kayıt okuyarak
+        grafı kurar. Eski dosyalardaki baglanti_sayisi alanı yok sayılır.
+
+        Args:
+            keep_weights: True ise dosyadaki ağırlık hesaplanandan farklıysa
+                elle atanmış ağırlık olarak korunur; False ise ağırlıklar
+                düğüm özelliklerinden yeniden hesaplanır (CSV yüklemesi gibi)
+        """
+        self.clear()
+        pending = array('q')   # kaynak, hedef, kaynak, hedef, ...
+        weights = array('d')
+
+        try:
+            with self.journal_paused():  # yükleme yeni taban oluşturur, günlüğe yazılmaz
+                with open(filename, mode='r', encoding='utf-8', buffering=1 << 20) as file:
+                    for kind, record in iter_graph_json(file):
+                        if kind == "node":
+                            self.add_node(Node(record['id'], record['name'],
+                                               record['aktiflik'], record['etkilesim']))
+                        else:
+                            pending.append(int(record['source']))
+                            pending.append(int(record['target']))
+                            weights.append(float(record.get('weight', 'nan')))
+
+                self.add_edges_bulk(zip(pending[::2], pending[1::2]))
+                if keep_weights:
+                    for id1, id2, weight in zip(pending[::2], pending[1::2], weights):
+                        edge = self.get_edge(id1, id2)
+                        if edge is not None and weight == weight and abs(edge.weight - weight) > 1e-9:
+                            edge.weight = weight
+                return True
+
+        except FileNotFoundError:
+            return "Dosya bulunamadı!"
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def load_from_snapshot(self, filename):
+        """
+        save_snapshot çıktısından düzenlenebilir grafı kurar. load_snapshot
+        salt okunur bir CSRGraph döndürür; düğüm ekleme/silme ve Algorithms'in
+        SocialGraph isteyen yöntemleri için bu yükleyici kullanılır. Dosyadaki
+        ağırlık hesaplanandan farklıysa elle atanmış ağırlık olarak korunur.
+
+        Returns:
+            True; hata durumunda load_from_csv gibi hata mesajı (str)
+        """
+        self.clear()
+        try:
+            csr = load_snapshot(filename, use_mmap=False)
+            ids, offsets, neighbors, weights = csr.ids, csr.offsets, csr.neighbors, csr.weights
+            names = csr.names
+            with self.journal_paused():  # yükleme yeni taban oluşturur, günlüğe yazılmaz
+                for i, node_id in enumerate(ids):
+                    name = names[i] if names is not None else str(node_id)
+                    self.add_node(Node(node_id, name, csr.aktiflik[i], csr.etkilesim[i]))
+                # Her yönsüz kenar CSR'da iki kez bulunur; i < j olan kopya alınır
+                pairs = [(i, neighbors[pos], weights[pos])
+                         for i in range(csr.num_nodes)
+                         for pos in range(offsets[i], offsets[i + 1]) if i < neighbors[pos]]
+                self.add_edges_bulk((ids[i], ids[j]) for i, j, _ in pairs)
+                for i, j, weight in pairs:
+                    edge = self.get_edge(ids[i], ids[j])
+                    if edge is not None and abs(edge.weight - weight) > 1e-9:
+                        edge.weight = weight
+            return True
+
+        except FileNotFoundError:
+            return "Dosya bulunamadı!"
+        except Exception as e:
+            return f"Hata: {str(e)}"
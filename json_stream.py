@@ -0,0 +1,173 @@
+"""
+Graf JSON dosyaları için akış (streaming) tabanlı yazıcı ve okuyucu.
+
+İki biçim desteklenir:
+    - Belge: {"nodes": [...], "edges": [...]} (girintili ya da compact)
+    - NDJSON: her satırda bir kayıt; {"type": "node", ...} / {"type": "edge", ...}
+
+Yazıcı düğüm ve kenarları gezildikçe dosyaya yazar, okuyucu da kayıtları
+dosyayı parça parça okuyarak tek tek üretir; hiçbir aşamada tüm graf tek bir
+sözlük/liste olarak bellekte tutulmaz.
+"""
+import json
+
+_SECTIONS = (("nodes", "node"), ("edges", "edge"))
+
+
+def write_graph_json(file, nodes, edges, indent=4, ndjson=False):
+    """
+    Düğüm ve kenar sözlüklerini açık bir metin dosyasına akış halinde yazar.
+
+    Args:
+        file: yazma kipinde açık dosya
+        nodes: düğüm sözlüklerinin iterable'ı (ör. Node.to_dict())
+        edges: {"source", "target", "weight"} sözlüklerinin iterable'ı
+        indent: belge biçiminde girinti; None ise boşluksuz compact çıktı
+        ndjson: True ise satır başına bir kayıt (indent yok sayılır)
+    """
+    if ndjson:
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+        for key, kind in _SECTIONS:
+            for record in (nodes if key == "nodes" else edges):
+                file.write(dumps({"type": kind, **record}))
+                file.write("\n")
+        return
+
+    if indent is None:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+        file.write('{')
+        for k, (key, _) in enumerate(_SECTIONS):
+            file.write(f'{"," if k else ""}"{key}":[')
+            for i, record in enumerate(nodes if key == "nodes" else edges):
+                if i:
+                    file.write(',')
+                file.write(encoder.encode(record))
+            file.write(']')
+        file.write('}')
+        return
+
+    # json.dump(..., indent=indent) ile bayt bayt aynı çıktı
+    encoder = json.JSONEncoder(ensure_ascii=False, indent=indent)
+    pad = ' ' * indent
+    item_pad = '\n' + pad * 2
+    file.write('{')
+    for k, (key, _) in enumerate(_SECTIONS):
+        file.write(f'{"," if k else ""}\n{pad}"{key}": [')
+        empty = True
+        for record in (nodes if key == "nodes" else edges):
+            file.write(item_pad if empty else ',' + item_pad)
+            file.write(encoder.encode(record).replace('\n', item_pad))
+            empty = False
+        file.write(']' if empty else f'\n{pad}]')
+    file.write('\n}')
+
+
+class _JsonReader:
+    """Dosyayı parça parça okuyarak JSON değerlerini sırayla çözen yardımcı"""
+
+    def __init__(self, file, chunk_size=1 << 16):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.mark = None  # geri dönülecek konum; tampon bu noktadan önce kırpılmaz
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        if self.eof:
+            return False
+        data = self.file.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        start = self.pos if self.mark is None else self.mark
+        self.buffer = self.buffer[start:] + data
+        self.pos -= start
+        if self.mark is not None:
+            self.mark = 0
+        return True
+
+    def peek(self):
+        """Boşlukları atlayıp sıradaki karakteri döndür (dosya sonunda '')"""
+        while True:
+            buffer, pos = self.buffer, self.pos
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                pos += 1
+            self.pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"JSON ayrıştırma hatası: '{char}' beklenirken '{found}' bulundu")
+        self.pos += 1
+
+    def value(self):
+        """Sıradaki tam JSON değerini çöz; tampon yetmezse dosyadan okumaya devam et"""
+        self.peek()
+        while True:
+            try:
+                result, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # Tampon sonunda biten bir sayı yarım kalmış olabilir
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return result
+
+
+def iter_graph_json(file):
+    """
+    write_graph_json (ya da eski json.dump) çıktısını kayıt kayıt okur.
+    Belge ve NDJSON biçimleri ilk karakterden otomatik ayırt edilir.
+    nodes/edges dışındaki anahtarlar atlanır.
+
+    Yields:
+        ("node" | "edge", kayıt sözlüğü)
+    """
+    reader = _JsonReader(file)
+    first = reader.peek()
+    if first == '':
+        return
+
+    if first == '{' and not _is_ndjson_record(reader):
+        kinds = dict(_SECTIONS)
+        reader.expect('{')
+        while reader.peek() != '}':
+            key = reader.value()
+            reader.expect(':')
+            if key in kinds and reader.peek() == '[':
+                reader.expect('[')
+                while reader.peek() != ']':
+                    yield kinds[key], reader.value()
+                    if reader.peek() == ',':
+                        reader.expect(',')
+                reader.expect(']')
+            else:
+                reader.value()
+            if reader.peek() == ',':
+                reader.expect(',')
+        reader.expect('}')
+        return
+
+    while reader.peek():
+        record = reader.value()
+        kind = record.pop("type", None)
+        if kind in ("node", "edge"):
+            yield kind, record
+
+
+def _is_ndjson_record(reader):
+    """Belge '{"nodes": [' ile, NDJSON satırı '{"type": ...}' ile başlar"""
+    reader.mark = reader.pos
+    reader.expect('{')
+    is_record = reader.peek() == '"' and reader.value() == "type"
+    reader.pos, reader.mark = reader.mark, None
+    return is_record
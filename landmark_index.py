@@ -0,0 +1,136 @@
+from array import array
+
+from algorithms import _as_csr, _sssp_lengths
+
+
+class LandmarkIndex:
+    """
+    A* için ALT (A*, Landmarks, Triangle inequality) ön hesaplaması.
+
+    Birkaç "işaret" (landmark) düğümünden tüm düğümlere en kısa yol
+    uzaklıkları bir kez hesaplanıp saklanır. Üçgen eşitsizliğinden her L için
+    d(u, t) >= |d(L, t) - d(L, u)| olduğundan bu farkların en büyüğü kabul
+    edilebilir (admissible) ve tutarlı (consistent) bir sezgiseldir; kenar
+    ağırlıklarının kendisinden türediği için aktiflik farkından çok daha
+    fazla budama sağlar.
+
+    İndeks kurulduğu andaki CSR görüntüsüne bağlıdır; kenar eklenir/silinir ya
+    da bir ağırlık değişirse (is_current False) yeniden kurulmalıdır. İsim
+    güncellemesi, bağlantısız düğüm ekleme gibi uzaklıkları etkilemeyen
+    değişiklikler indeksi geçersiz kılmaz (SocialGraph.distance_version).
+
+    Ne zaman değer? Kurulum num_landmarks tam Dijkstra demektir (50k düğümde
+    saniyeler mertebesi) ve her sorguda sezgisel için ek tablo okumaları
+    gerekir. Ölçümlerde tek tek sorgularda çift yönlü Dijkstra ALT'li A*'dan
+    hızlı çıktı; ALT yalnızca aynı (değişmeyen) graf üzerinde çok sayıda uzak
+    nokta sorgusu yapılacaksa, kurulum maliyeti sorgulara yayılabildiğinde
+    tercih edilmelidir. Bu yüzden arayüzde varsayılan değil, isteğe bağlıdır.
+    """
+
+    def __init__(self, graph, num_landmarks=8, active=4):
+        """
+        Args:
+            graph: SocialGraph, CompactSocialGraph ya da CSRGraph
+            num_landmarks: saklanacak işaret sayısı (her biri V boyutlu bir tablo)
+            active: her sorguda kullanılacak en iyi işaret sayısı
+        """
+        self.csr = _as_csr(graph)
+        self.graph = graph
+        self.version = self._distance_version(graph)
+        self.active = active
+        self.landmarks = []   # işaret düğümlerinin indeksleri
+        self.tables = []      # tables[k][i]: k. işaretten i. düğüme uzaklık
+        self._select(num_landmarks)
+
+    def _select(self, num_landmarks):
+        """
+        En uzak nokta (farthest-first) seçimi: ilk işaret en yüksek dereceli
+        düğümdür (büyük bileşende olması beklenir), sonrakiler seçilmiş
+        işaretlere en uzak ulaşılabilir düğümlerdir. Başka bileşenlerdeki
+        düğümler için sınır sonsuz çıkar ve A* aramaya hiç başlamaz.
+        """
+        csr = self.csr
+        n = csr.num_nodes
+        if n == 0:
+            return
+        inf = float('inf')
+        nearest = [inf] * n
+        candidate = max(range(n), key=csr.degree)
+        for _ in range(min(num_landmarks, n)):
+            dist = _sssp_lengths(csr, candidate, True)
+            self.landmarks.append(candidate)
+            self.tables.append(array('d', dist))
+            for i, d in enumerate(dist):
+                if d < nearest[i]:
+                    nearest[i] = d
+            candidate = max(range(n), key=lambda i: nearest[i] if nearest[i] < inf else -1.0)
+            if not 0 < nearest[candidate] < inf:
+                break  # ulaşılabilir tüm düğümler zaten işaret
+
+    def __len__(self):
+        return len(self.landmarks)
+
+    def is_current(self, graph):
+        """Tablolar graph'ın güncel haliyle mi kuruldu?"""
+        if graph is self.csr:
+            return True
+        return graph is self.graph and self._distance_version(graph) == self.version
+
+    @staticmethod
+    def _distance_version(graph):
+        """Uzaklıkları etkileyen değişikliklerin sürümü (yoksa genel sürüm)"""
+        return getattr(graph, 'distance_version', getattr(graph, 'version', None))
+
+    def lower_bound(self, source, target):
+        """İki düğüm indeksi arasındaki uzaklık için tüm işaretlerle alt sınır"""
+        return self._bound(self.tables, source, target)
+
+    @staticmethod
+    def _bound(tables, source, target):
+        inf = float('inf')
+        best = 0.0
+        for table in tables:
+            ds, dt = table[source], table[target]
+            if ds == inf or dt == inf:
+                if ds != dt:
+                    return inf  # farklı bileşenler: yol yok
+                continue
+            bound = ds - dt if ds > dt else dt - ds
+            if bound > best:
+                best = bound
+        return best
+
+    def heuristic_to(self, source, target):
+        """
+        target'a olan uzaklık için h(i) fonksiyonu (düğüm indeksleri üzerinde).
+        Yalnızca source -> target için en sıkı sınırı veren `active` işaret
+        kullanılır; hesaplanan değerler sorgu boyunca önbelleğe alınır.
+        """
+        tables = self.tables
+        if len(tables) > self.active:
+            tables = sorted(tables, key=lambda table: -self._bound([table], source, target))[:self.active]
+        targets = [(table, table[target]) for table in tables]
+        inf = float('inf')
+        cache = {}
+
+        def heuristic(i):
+            value = cache.get(i)
+            if value is None:
+                value = 0.0
+                for table, dt in targets:
+                    di = table[i]
+                    if di == inf or dt == inf:
+                        if di != dt:
+                            value = inf
+                            break
+                        continue
+                    bound = di - dt if di > dt else dt - di
+                    if bound > value:
+                        value = bound
+                cache[i] = value
+            return value
+
+        return heuristic
+
+    def __repr__(self):
+        return f"LandmarkIndex(landmarks={[self.csr.ids[i] for i in self.landmarks]})"
@@ -2,8 +2,27 @@ import tkinter as tk
 from tkinter import messagebox, simpledialog, filedialog, ttk
 import random
 import math
+import os
+import colorsys
 from graph import SocialGraph
 from algorithms import Algorithms
+from snapshot import save_snapshot
+from change_journal import ChangeJournal
+from landmark_index import LandmarkIndex
+
+def color_palette(count):
+    """
+    Renk sınıfı sayısı kadar birbirinden ayırt edilebilir hex renk üretir.
+    İlk renkler sabit paletten, kalanlar altın oran adımlı tonlardan gelir.
+    """
+    base = ["#FF5733", "#33FF57", "#3357FF", "#F0FF33", "#FF33F0", "#33FFF6"]
+    palette = base[:count]
+    hue = 0.0
+    while len(palette) < count:
+        hue = (hue + 0.618033988749895) % 1.0
+        r, g, b = colorsys.hsv_to_rgb(hue, 0.65, 0.95)
+        palette.append(f"#{int(r * 255):02X}{int(g * 255):02X}{int(b * 255):02X}")
+    return palette
 
 class ModernButton(tk.Canvas):
     """Özel modern buton widget'ı"""
@@ -82,8 +101,16 @@ class App(tk.Tk):
         self.node_velocities = {}
         self.show_labels = True
         self.dark_mode = True
+        self.use_landmarks = False  # A* için ALT işaretleri (isteğe bağlı)
+
+        self._landmarks = None
+        self._betweenness = None  # (graf sürümü, skorlar, yaklaşık sonuç)
+        self._pagerank = None     # (graf sürümü, skorlar)
+        self._base_synced = True  # taban dosya(lar) grafın günlük öncesi halini içeriyor mu
 
         self.setup_ui()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.open_journal()
 
         self.node_positions = {}
         self.selected_node = None
@@ -109,10 +136,13 @@ class App(tk.Tk):
         file_menu = tk.Menu(menubar, tearoff=0, bg="#34495e", fg="white")
         menubar.add_cascade(label="📁 Dosya", menu=file_menu)
         file_menu.add_command(label="CSV Yükle", command=self.load_csv)
+        file_menu.add_command(label="Parçalı CSV Yükle (Çoklu)", command=self.load_csv_shards)
         file_menu.add_command(label="JSON Kaydet", command=self.save_json)
+        file_menu.add_command(label="Binary Snapshot Kaydet", command=self.save_snapshot)
+        file_menu.add_command(label="Binary Snapshot Yükle", command=self.load_snapshot)
         file_menu.add_command(label="Görüntü Olarak Kaydet", command=self.save_as_image)
         file_menu.add_separator()
-        file_menu.add_command(label="Çıkış", command=self.quit)
+        file_menu.add_command(label="Çıkış", command=self.on_close)
 
         view_menu = tk.Menu(menubar, tearoff=0, bg="#34495e", fg="white")
         menubar.add_cascade(label="👁️ Görünüm", menu=view_menu)
@@ -122,6 +152,10 @@ class App(tk.Tk):
         view_menu.add_separator()
         view_menu.add_command(label="Karanlık/Aydınlık Mod", command=self.toggle_theme)
 
+        settings_menu = tk.Menu(menubar, tearoff=0, bg="#34495e", fg="white")
+        menubar.add_cascade(label="⚙️ Ayarlar", menu=settings_menu)
+        settings_menu.add_command(label="A* için ALT İşaretleri (Aç/Kapa)", command=self.toggle_landmarks)
+
         # Üst bilgi paneli
         self.stats_panel = StatsPanel(self)
         self.stats_panel.pack(side="top", fill="x")
@@ -196,9 +230,12 @@ class App(tk.Tk):
             ]),
             ("📊 ANALİZ ARAÇLARI", [
                 ("👑 Top 5 Etkililer", self.run_analysis),
+                ("⭐ PageRank Etkililer", self.run_pagerank),
                 ("🎨 Grafik Renklendirme", self.run_coloring),
+                ("🧩 DSatur Renklendirme", lambda: self.run_coloring("dsatur")),
                 ("👥 Topluluk Tespiti", self.run_community_detection),
-                ("🔥 Merkezi Analiz", self.run_betweenness)
+                ("🔥 Merkezi Analiz", self.run_betweenness),
+                ("📍 Yakınlık Analizi", self.run_closeness)
             ]),
             ("✏️ DÜZENLEME", [
                 ("✨ Düğüm Ekle", self.add_new_node),
@@ -415,6 +452,18 @@ düğümleri sürükleyebilirsiniz!
         else:
             self.log("Fizik simülasyonu kapatıldı", "INFO")
 
+    def toggle_landmarks(self):
+        """
+        ALT tabloları ilk sorguda num_landmarks tam Dijkstra ile kurulur; yalnızca
+        değişmeyen bir graf üzerinde çok sayıda A* sorgusu yapılacaksa açılmalıdır.
+        """
+        self.use_landmarks = not self.use_landmarks
+        if self.use_landmarks:
+            self.log("A* için ALT işaretleri aktif (ilk sorguda kurulur)", "INFO")
+        else:
+            self._landmarks = None
+            self.log("A* için ALT işaretleri kapatıldı", "INFO")
+
     def run_physics(self):
         if not self.physics_enabled:
             return
@@ -503,18 +552,12 @@ düğümleri sürükleyebilirsiniz!
                 if result["weight"] is not None:
                     self.graph.add_edge(self.selected_node.id, clicked.id)
                     # Manuel olarak weight'i ayarla
-                    for edge in self.graph.edges:
-                        if ((edge.source.id == self.selected_node.id and edge.target.id == clicked.id) or
-                            (edge.source.id == clicked.id and edge.target.id == self.selected_node.id)):
-                            edge.weight = result["weight"]
-                            break
+                    self.graph.set_edge_weight(self.selected_node.id, clicked.id, result["weight"])
 
                     self.log(f"Bağlantı: {self.selected_node.id} ↔ {clicked.id} (Ağırlık: {result['weight']})", "SUCCESS")
 
-                    # Otomatik kaydet
-                    if hasattr(self.graph, 'csv_file_path') and self.graph.csv_file_path:
-                        self.save_to_csv(self.graph.csv_file_path)
-                    self.graph.save_to_json()
+                    # Otomatik kaydet (değişiklik günlüğü)
+                    self.persist_change()
 
                 self.selected_node = None
                 self.draw_graph()
@@ -533,6 +576,7 @@ düğümleri sürükleyebilirsiniz!
                     del self.node_positions[clicked.id]
                 self.draw_graph()
                 self.log(f"Düğüm silindi: {clicked.name}", "WARNING")
+                self.persist_change()
 
     def on_zoom(self, event):
         """Mouse wheel ile zoom"""
@@ -639,7 +683,7 @@ düğümleri sürükleyebilirsiniz!
                 from graph import Node
                 # BaglantiSayisi başlangıçta 0
                 new_node = Node(nid, name, aktiflik, etkilesim)
-                self.graph.nodes[nid] = new_node
+                self.graph.add_node(new_node)
                 self.node_positions[nid] = (random.randint(100, 700), random.randint(100, 500))
 
                 result["added"] = True
@@ -668,32 +712,184 @@ düğümleri sürükleyebilirsiniz!
             self.log(f"Yeni düğüm eklendi: {name_entry.get()} (ID: {id_entry.get()})", "SUCCESS")
             messagebox.showinfo("✅ Başarılı", f"Düğüm başarıyla eklendi!\n\n{name_entry.get()}")
 
-            # Otomatik kaydet
-            if hasattr(self.graph, 'csv_file_path') and self.graph.csv_file_path:
-                self.save_to_csv(self.graph.csv_file_path)
-            self.graph.save_to_json()
+            # Otomatik kaydet (değişiklik günlüğü)
+            self.persist_change()
 
     # ✅✅✅ FIX 1: load_csv (csv_file_path kesin set olsun)
     def load_csv(self):
         filename = filedialog.askopenfilename(title="CSV Seç", filetypes=(("CSV Files", "*.csv"),))
         if filename:
+            # Eski tabanın günlüğü yükleme sırasında (ve hata halinde) grafa bağlı kalmamalı
+            self.detach_journal()
             res = self.graph.load_from_csv(filename)
 
-            # DÜZELTME: load_from_csv bazen True yerine farklı truthy döndürür -> "res is True" takılır.
-            if res:
+            # load_from_csv başarıda True, hatada mesaj (str) döndürür
+            if res is True:
                 self.graph.csv_file_path = filename
+                self.open_journal(replay=True)
                 self.node_positions = {}
                 self.auto_layout()
                 self.log(f"CSV başarıyla yüklendi: {filename}", "SUCCESS")
             else:
+                # Yarım yüklenmiş graf taban olarak yazılmamalı; boş grafla devam edilir
+                self.graph.clear()
+                self.graph.csv_file_path = None
+                self.open_journal()
+                self.node_positions = {}
+                self.draw_graph()
                 messagebox.showerror("❌ Hata", str(res))
                 self.log(f"CSV yükleme hatası: {res}", "ERROR")
 
+    def load_csv_shards(self):
+        filenames = filedialog.askopenfilenames(title="CSV Parçalarını Seç", filetypes=(("CSV Files", "*.csv"),))
+        if filenames:
+            self.detach_journal()
+            res = self.graph.load_from_csv_shards(filenames)
+            if res is not True:
+                self.graph.clear()  # yarım kalmış birleştirme taban olarak yazılmaz
+            # Birleşik graf tek bir CSV'ye ait değil; taban graph_data.json olur
+            self.graph.csv_file_path = None
+            self.open_journal()
+            if res is True:
+                self.node_positions = {}
+                self.auto_layout()
+                self.log(f"{len(filenames)} CSV parçası birleştirildi "
+                         f"({len(self.graph.nodes)} düğüm, {len(self.graph.edges)} bağlantı)", "SUCCESS")
+            else:
+                self.node_positions = {}
+                self.draw_graph()
+                messagebox.showerror("❌ Hata", str(res))
+                self.log(f"Parçalı CSV yükleme hatası: {res}", "ERROR")
+
+    def open_journal(self, replay=False):
+        """
+        Geçerli tabanın (CSV, yoksa graph_data.json) yanındaki değişiklik
+        günlüğünü grafa bağlar. replay=True ise taban yeni yüklendiği için
+        önceki oturumdan kalan (sıkıştırılmamış) kayıtlar önce uygulanır.
+        Aksi halde taban bu grafı içermeyebilir: graf boş değilse taban hemen
+        yeniden yazılır; boşsa (uygulama açılışı) önceki oturumdan kalan
+        kayıtlar graph_data.json'a işlenir ve taban ilk düzenlemede yazılır.
+        """
+        self.detach_journal()
+        csv_path = getattr(self.graph, 'csv_file_path', None)
+        base = csv_path or "graph_data.json"
+        journal = ChangeJournal(base + ".journal")
+        self._base_synced = True
+        if replay:
+            applied = journal.replay(self.graph)
+            if applied:
+                self.log(f"Değişiklik günlüğünden {applied} kayıt uygulandı", "INFO")
+        elif self.graph.nodes or csv_path:
+            self._base_synced = journal.compact(self.write_base)
+        else:
+            if journal.pending:
+                self.recover_journal(journal, base)
+            self._base_synced = False
+        self.graph.attach_journal(journal)
+
+    def recover_journal(self, journal, base):
+        """
+        Çökmüş bir oturumdan kalan kayıtları, açık grafı değiştirmeden JSON
+        tabanına işler; böylece boş grafla açılışta bu düzenlemeler kaybolmaz.
+        """
+        recovered = SocialGraph()
+        if os.path.exists(base):
+            res = recovered.load_from_json(base, keep_weights=True)
+            if res is not True:
+                self.log(f"Günlük kurtarılamadı, taban okunamadı: {res}", "ERROR")
+                return
+        applied = journal.replay(recovered)
+        if journal.compact(lambda: recovered.save_to_json(base)):
+            self.log(f"Önceki oturumdan kalan {applied} kayıt {base} dosyasına işlendi", "INFO")
+
+    def detach_journal(self):
+        """Günlüğü graftan ayır; bekleyen kayıtlar önce ana dosyalara işlenir"""
+        journal = self.graph.journal
+        if journal is None:
+            return
+        if journal.pending:
+            journal.compact(self.write_base)
+        journal.close()
+        self.graph.attach_journal(None)
+
+    def write_base(self):
+        """Grafın tamamını ana dosyalara (CSV + JSON) yaz"""
+        ok = True
+        if hasattr(self.graph, 'csv_file_path') and self.graph.csv_file_path:
+            ok = self.save_to_csv(self.graph.csv_file_path)
+        self.graph.save_to_json()
+        return ok
+
+    def persist_change(self):
+        """
+        Graf değişikliği zaten günlüğe eklendi (O(1) yazma). Taban henüz bu
+        grafı içermiyorsa ya da biriken kayıt sayısı eşiği aştıysa ana
+        dosyalar bir kez yeniden yazılır ve günlük boşaltılır.
+        """
+        journal = self.graph.journal
+        if journal is None:
+            return self.write_base()
+        if not self._base_synced:
+            self._base_synced = journal.compact(self.write_base)
+        elif journal.needs_compaction():
+            if journal.compact(self.write_base):
+                self.log("Değişiklik günlüğü ana dosyalara işlendi", "INFO")
+        return True
+
+    def get_landmarks(self):
+        """
+        Ayarlardan açıldıysa büyük graflarda A* için ALT işaret tabloları; ilk A*
+        sorgusunda kurulur, yalnızca kenarlar ya da ağırlıklar değiştiğinde
+        yeniden kurulur.
+        """
+        if not self.use_landmarks or len(self.graph.nodes) < 500:
+            return None
+        if self._landmarks is None or not self._landmarks.is_current(self.graph):
+            self._landmarks = LandmarkIndex(self.graph)
+        return self._landmarks
+
+    def on_close(self):
+        """Çıkmadan önce bekleyen günlük kayıtlarını ana dosyalara işle"""
+        self.detach_journal()
+        self.destroy()
+
     def save_json(self):
         self.graph.save_to_json()
         messagebox.showinfo("💾 Kayıt", "Veriler 'graph_data.json' olarak kaydedildi.")
         self.log("JSON dosyası kaydedildi", "SUCCESS")
 
+    def save_snapshot(self):
+        filename = filedialog.asksaveasfilename(defaultextension=".snap",
+                                                filetypes=[("Graph Snapshot", "*.snap")])
+        if not filename:
+            return
+        if save_snapshot(self.graph, filename):
+            messagebox.showinfo("💾 Kayıt", f"Snapshot kaydedildi:\n{filename}")
+            self.log(f"Binary snapshot kaydedildi: {filename}", "SUCCESS")
+        else:
+            messagebox.showerror("❌ Hata", "Snapshot kaydedilemedi.")
+            self.log("Snapshot kaydetme hatası", "ERROR")
+
+    def load_snapshot(self):
+        filename = filedialog.askopenfilename(title="Snapshot Seç", filetypes=[("Graph Snapshot", "*.snap")])
+        if filename:
+            self.detach_journal()
+            res = self.graph.load_from_snapshot(filename)
+            if res is not True:
+                self.graph.clear()  # yarım kalmış yükleme taban olarak yazılmaz
+            # Snapshot düzenlenebilir bir taban değil; taban graph_data.json olur
+            self.graph.csv_file_path = None
+            self.open_journal()
+            self.node_positions = {}
+            if res is True:
+                self.auto_layout()
+                self.log(f"Binary snapshot yüklendi: {filename} "
+                         f"({len(self.graph.nodes)} düğüm, {len(self.graph.edges)} bağlantı)", "SUCCESS")
+            else:
+                self.draw_graph()
+                messagebox.showerror("❌ Hata", str(res))
+                self.log(f"Snapshot yükleme hatası: {res}", "ERROR")
+
     def save_to_csv(self, filename):
         """CSV dosyasına kaydet - Orijinal formatta"""
         try:
@@ -742,8 +938,13 @@ düğümleri sürükleyebilirsiniz!
             title="CSV Olarak Kaydet"
         )
         if filename:
-            if self.save_to_csv(filename):
+            # Bekleyen kayıtlar yeni dosyaya değil, ait oldukları eski tabana işlenir
+            self.detach_journal()
+            saved = self.save_to_csv(filename)
+            if saved:
                 self.graph.csv_file_path = filename
+            self.open_journal()
+            if saved:
                 messagebox.showinfo("✅ Başarılı", f"CSV kaydedildi:\n{filename}")
             else:
                 messagebox.showerror("❌ Hata", "CSV kaydetme başarısız!")
@@ -846,7 +1047,7 @@ düğümleri sürükleyebilirsiniz!
             if algo_type == "Dijkstra":
                 path, cost = Algorithms.dijkstra(self.graph, s_id, e_id)
             else:
-                path, cost = Algorithms.a_star(self.graph, s_id, e_id)
+                path, cost = Algorithms.a_star(self.graph, s_id, e_id, landmarks=self.get_landmarks())
 
             if path:
                 path_str = " → ".join(str(p) for p in path)
@@ -897,19 +1098,52 @@ düğümleri sürükleyebilirsiniz!
 
         messagebox.showinfo("👑 Etki Analizi", result_text)
 
-    def run_coloring(self):
-        """Welsh-Powell grafik renklendirme"""
-        colors = Algorithms.welsh_powell(self.graph)
+    def run_pagerank(self):
+        """PageRank'e göre Top 5 kullanıcı (komşuların etkisi de hesaba katılır)"""
+        cached = self._pagerank
+        if cached is not None and cached[0] == self.graph.version:
+            scores = cached[1]
+        else:
+            # Graf değiştiyse önceki skorlardan başlanır; birkaç iterasyonda yakınsar
+            scores = Algorithms.pagerank(self.graph, start=cached[1] if cached else None)
+            self._pagerank = (self.graph.version, scores)
+        top5 = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:5]
+
+        self.log("=" * 50, "INFO")
+        self.log("⭐ PAGERANK - EN ETKİLİ 5 KULLANICI", "SUCCESS")
+        self.log("=" * 50, "INFO")
+
+        result_text = "⭐ PAGERANK SONUÇLARI\n\n"
+        medals = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣"]
+
+        for i, (nid, score) in enumerate(top5):
+            node = self.graph.nodes[nid]
+            medal = medals[i] if i < len(medals) else "•"
+            self.log(f"{medal} {node.name} (ID: {node.id}) - PageRank: {score:.4f}", "INFO")
+            result_text += f"{medal} {node.name}\n   ID: {node.id}\n   PageRank: {score:.4f}\n\n"
+
+        messagebox.showinfo("⭐ PageRank Analizi", result_text)
+
+    def run_coloring(self, method="welsh_powell"):
+        """Welsh-Powell (veya DSatur) grafik renklendirme"""
+        if method == "dsatur":
+            classes = Algorithms.dsatur(self.graph)
+        else:
+            classes = Algorithms.welsh_powell(self.graph)
+
+        unique_colors = len(set(classes.values()))
+        palette = color_palette(unique_colors)
+        colors = {nid: palette[c] for nid, c in classes.items()}
         self.draw_graph(custom_colors=colors)
 
-        unique_colors = len(set(colors.values()))
         self.log(f"Grafik renklendirildi - {unique_colors} farklı renk kullanıldı", "SUCCESS")
         messagebox.showinfo("🎨 Renklendirme",
                            f"Grafik başarıyla renklendi!\n\nKullanılan renk sayısı: {unique_colors}")
 
     def run_community_detection(self):
         """Topluluk tespiti - Bağlı bileşenler"""
-        components = Algorithms.find_connected_components(self.graph)
+        # Bileşenler graf ile birlikte güncel tutulan union-find indeksinden okunur
+        components = self.graph.components().groups()
 
         self.log("=" * 50, "INFO")
         self.log(f"👥 TOPLULUK ANALİZİ - {len(components)} Grup Bulundu", "SUCCESS")
@@ -938,28 +1172,40 @@ düğümleri sürükleyebilirsiniz!
     def run_betweenness(self):
         """Betweenness centrality analizi"""
         try:
-            betweenness = {nid: 0 for nid in self.graph.nodes}
-
-            nodes = list(self.graph.nodes.keys())
-            for i, start in enumerate(nodes):
-                for end in nodes[i+1:]:
-                    path, _ = Algorithms.dijkstra(self.graph, start, end)
-                    if path:
-                        for node in path[1:-1]:  # Başlangıç ve bitiş hariç
-                            betweenness[node] += 1
-
+            n = len(self.graph.nodes)
+            bounds = approx = None
+            cached = self._betweenness
+            if cached is not None and cached[0] == self.graph.version:
+                # Graf değişmediyse önceki sonuç aynen geçerli
+                _, betweenness, approx = cached
+                if approx is not None:
+                    bounds = approx["bounds"]
+            elif n >= 5000:
+                # Çok büyük graflarda tam hesap yerine birkaç saniyelik örnekleme
+                approx = Algorithms.approximate_betweenness(self.graph, time_budget=5.0, strategy="degree")
+                betweenness, bounds = approx["scores"], approx["bounds"]
+            else:
+                # Büyük graflarda kaynak düğümler tüm çekirdeklere dağıtılır
+                workers = os.cpu_count() if n >= 2000 else None
+                betweenness = Algorithms.betweenness_centrality(self.graph, workers=workers)
+            self._betweenness = (self.graph.version, betweenness, approx)
             sorted_bet = sorted(betweenness.items(), key=lambda x: x[1], reverse=True)[:5]
 
             self.log("=" * 50, "INFO")
             self.log("🔥 ARACILIK MERKEZİLİĞİ ANALİZİ", "SUCCESS")
+            if bounds is not None:
+                self.log(f"Yaklaşık sonuç: {approx['samples']} pivot, %{approx['confidence'] * 100:g} güven aralığı", "WARNING")
             self.log("=" * 50, "INFO")
 
             result_text = "🔥 EN YÜKSEK ARACILIK MERKEZİLİĞİ\n\n"
+            if bounds is not None:
+                result_text += f"(Yaklaşık: {approx['samples']} örnek kaynak)\n\n"
 
             for nid, score in sorted_bet:
                 node = self.graph.nodes[nid]
-                self.log(f"• {node.name} (ID: {nid}) - Skor: {score}", "INFO")
-                result_text += f"• {node.name}\n   ID: {nid}\n   Aracılık Skoru: {score}\n\n"
+                score_str = f"{score:.4f}" if bounds is None else f"{score:.4f} ± {bounds[nid]:.4f}"
+                self.log(f"• {node.name} (ID: {nid}) - Skor: {score_str}", "INFO")
+                result_text += f"• {node.name}\n   ID: {nid}\n   Aracılık Skoru: {score_str}\n\n"
 
             messagebox.showinfo("🔥 Aracılık Analizi", result_text)
 
@@ -967,6 +1213,45 @@ düğümleri sürükleyebilirsiniz!
             self.log(f"Aracılık analizi hatası: {str(e)}", "ERROR")
             messagebox.showerror("Hata", f"Analiz sırasında hata oluştu:\n{str(e)}")
 
+    def run_closeness(self):
+        """Harmonik yakınlık merkeziliği - en yüksek 5 düğüm"""
+        try:
+            # Harmonik skor bağlı olmayan graflarda da anlamlıdır; top-k taraması
+            # ilk 5'e giremeyecek kaynakları erkenden eler
+            n = len(self.graph.nodes)
+            if n >= 5000:
+                # Çok büyük graflarda birkaç saniyelik pivot örneklemesi
+                scores = Algorithms.approximate_harmonic(self.graph, time_budget=5.0)
+                top5 = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:5]
+                note = "Yaklaşık sonuç (örnek pivot kaynaklar)"
+            elif n >= 1000:
+                # Ağırlıklı sınırlar zayıf kaldığından adım sayısıyla (BFS) budanır
+                top5 = Algorithms.top_k_closeness(self.graph, k=5, weighted=False, harmonic=True)
+                note = "Adım sayısına göre (ağırlıksız)"
+            else:
+                top5 = Algorithms.top_k_closeness(self.graph, k=5, harmonic=True)
+                note = None
+
+            self.log("=" * 50, "INFO")
+            self.log("📍 YAKINLIK MERKEZİLİĞİ ANALİZİ", "SUCCESS")
+            if note:
+                self.log(note, "WARNING")
+            self.log("=" * 50, "INFO")
+
+            result_text = "📍 EN YÜKSEK YAKINLIK MERKEZİLİĞİ\n\n"
+            if note:
+                result_text += f"({note})\n\n"
+            for nid, score in top5:
+                node = self.graph.nodes[nid]
+                self.log(f"• {node.name} (ID: {nid}) - Skor: {score:.4f}", "INFO")
+                result_text += f"• {node.name}\n   ID: {nid}\n   Harmonik Skor: {score:.4f}\n\n"
+
+            messagebox.showinfo("📍 Yakınlık Analizi", result_text)
+
+        except Exception as e:
+            self.log(f"Yakınlık analizi hatası: {str(e)}", "ERROR")
+            messagebox.showerror("Hata", f"Analiz sırasında hata oluştu:\n{str(e)}")
+
     # ✅✅✅ FIX 2: update_selected_node (graph.nodes dict kesin güncellensin + CSV'ye yazılsın)
     def update_selected_node(self):
         """Seçili düğümü güncelle - Hem ekranda hem CSV'de günceller (FIX)"""
@@ -1027,16 +1312,9 @@ düğümleri sürükleyebilirsiniz!
                     messagebox.showerror("Hata", "İsim boş olamaz!", parent=dialog)
                     return
 
-                # 1) UI'daki seçili node'u güncelle
-                self.selected_node.name = new_name
-                self.selected_node.aktiflik = new_aktiflik
-
-                # 2) ✅ EN KRİTİK: graph.nodes sözlüğünü de güncelle (CSV buradan yazılıyor)
-                self.graph.nodes[self.selected_node.id] = self.selected_node
-
-                # 3) ❌ Bu bazı projelerde eski veriyi geri "ezebiliyor", şimdilik kapalı
-                # if hasattr(self.graph, 'update_node'):
-                #     self.graph.update_node(self.selected_node.id, new_name, new_aktiflik)
+                # selected_node, graph.nodes içindeki objenin kendisi; update_node hem
+                # düğümü günceller hem de bağlı kenarların ağırlıklarını kirli işaretler
+                self.graph.update_node(self.selected_node.id, new_name, new_aktiflik)
 
                 updated_vals["name"] = new_name
                 updated_vals["aktiflik"] = new_aktiflik
@@ -1068,15 +1346,11 @@ düğümleri sürükleyebilirsiniz!
             self.log(f"✅ Düğüm güncellendi: {updated_vals['name']} (ID: {self.selected_node.id})", "SUCCESS")
 
             try:
-                # JSON kaydet
-                self.graph.save_to_json()
-                self.log("📁 JSON dosyasına kaydedildi", "INFO")
-
-                # CSV kaydet
-                if hasattr(self.graph, 'csv_file_path') and self.graph.csv_file_path:
-                    self.save_to_csv(self.graph.csv_file_path)
-                    self.log(f"📁 CSV dosyasına kaydedildi: {self.graph.csv_file_path}", "SUCCESS")
-                else:
+                # Değişiklik günlüğe eklendi; ana dosyalar eşik aşılınca yeniden yazılır
+                self.persist_change()
+                self.log("📝 Değişiklik günlüğe kaydedildi", "INFO")
+
+                if not (hasattr(self.graph, 'csv_file_path') and self.graph.csv_file_path):
                     save_csv = messagebox.askyesno("💾 CSV Kaydet",
                                                    "Değişiklikler CSV dosyasına kaydedilsin mi?")
                     if save_csv:
@@ -1158,9 +1432,7 @@ düğümleri sürükleyebilirsiniz!
             self.log(f"Bağlantı silindi: {id1_entry.get()} ↔ {id2_entry.get()}", "WARNING")
             messagebox.showinfo("✅ Başarılı", f"Bağlantı silindi:\n{id1_entry.get()} ↔ {id2_entry.get()}")
 
-            if hasattr(self.graph, 'csv_file_path') and self.graph.csv_file_path:
-                self.save_to_csv(self.graph.csv_file_path)
-            self.graph.save_to_json()
+            self.persist_change()
 
     def reset_view(self):
         """Görünümü sıfırla"""
@@ -3,6 +3,8 @@ class Node:
     Sosyal ağ düğümünü temsil eden sınıf.
     baglanti_sayisi artık dinamik olarak graph'tan hesaplanacak.
     """
+    __slots__ = ('id', 'name', 'aktiflik', 'etkilesim')  # örnek başına __dict__ yok
+
     def __init__(self, user_id, name, aktiflik, etkilesim):
         self.id = int(user_id)
         self.name = name
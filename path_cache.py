@@ -0,0 +1,180 @@
+from collections import OrderedDict, namedtuple
+
+PathResult = namedtuple('PathResult', ['path', 'cost'])
+PathResult.__doc__ = """
+Yol bulma sonucu: path başlangıçtan hedefe düğüm listesi (yol yoksa boş),
+cost toplam ağırlık (yol yoksa inf). Tuple olduğundan `path, cost = ...`
+biçiminde açılabilir."""
+
+
+class ShortestPathTree:
+    """
+    En kısa yol ağacı. Yalnızca kaynaktan ulaşılabilen düğümler için uzaklık,
+    önceki düğüm ve ağaçtaki ebeveyn kenarının ağırlığı tutulur. Çok kaynaklı
+    aramada source kaynakların tuple'ıdır ve her kaynağın önceki düğümü None'dır.
+    """
+    __slots__ = ('source', 'dist', 'previous', 'parent_weight', 'version')
+
+    def __init__(self, source, dist, previous, parent_weight, version=None):
+        self.source = source
+        self.dist = dist                    # düğüm -> uzaklık
+        self.previous = previous            # düğüm -> ağaçtaki ebeveyn (kaynak için None)
+        self.parent_weight = parent_weight  # düğüm -> ebeveyn kenarının ağırlığı
+        self.version = version              # hesaplandığı andaki graf sürümü
+
+    def __len__(self):
+        return len(self.dist)
+
+    def distance(self, target):
+        return self.dist.get(target, float('inf'))
+
+    def path_to(self, target):
+        """Kaynaktan target'a yol; ağaç üzerinde geriye yürünerek O(L)"""
+        if target not in self.dist:
+            return PathResult([], float('inf'))
+        path = []
+        node = target
+        while node is not None:
+            path.append(node)
+            node = self.previous[node]
+        path.reverse()
+        return PathResult(path, self.dist[target])
+
+    def nearest_source(self, target):
+        """Çok kaynaklı ağaçta target'a en yakın kaynak (ulaşılamıyorsa None)"""
+        if target not in self.dist:
+            return None
+        node = target
+        while self.previous[node] is not None:
+            node = self.previous[node]
+        return node
+
+    def is_affected(self, graph, touched, removed_edges, removed_nodes):
+        """
+        Değişiklik bu ağacı bozuyor mu? Ağaç ancak şu durumlarda geçersizdir:
+        silinen bir düğüm ağaçtaysa, silinen kenar bir ağaç kenarıysa, ağaç
+        kenarının ağırlığı değiştiyse ya da ağaç dışı bir kenar artık daha kısa
+        bir yol sunuyorsa. Ağırlığı değişebilecek kenarların hepsi touched
+        düğümlerine bağlı olduğundan yalnızca onların kenarlarına bakılır.
+        """
+        dist, previous, parent_weight = self.dist, self.previous, self.parent_weight
+        for node_id in removed_nodes:
+            if node_id in dist:
+                return True
+        for a, b in removed_edges:
+            if previous.get(b) == a or previous.get(a) == b:
+                return True
+
+        inf = float('inf')
+        adjacency = graph.adjacency_list
+        for x in touched:
+            dx = dist.get(x, inf)
+            for y, edge in adjacency.get(x, {}).items():
+                w = edge.weight
+                if previous.get(y) == x:
+                    if w != parent_weight[y]:
+                        return True
+                elif previous.get(x) == y:
+                    if w != parent_weight[x]:
+                        return True
+                else:
+                    dy = dist.get(y, inf)
+                    if dx + w < dy or dy + w < dx:
+                        return True
+        return False
+
+
+class ShortestPathCache:
+    """
+    Tek kaynaklı en kısa yol ağaçları için LRU önbellek.
+
+    Toplam boyut, ağaçlardaki düğüm kaydı sayısıyla (max_entries) sınırlanır;
+    sınır aşılınca en uzun süredir kullanılmayan ağaçlar atılır. Graf
+    değiştiğinde SocialGraph on_change'i çağırır ve yalnızca değişiklikten
+    gerçekten etkilenen ağaçlar düşürülür; toplu değişikliklerde clear.
+
+    Bir kaynak için ağaç, o kaynaktan cache_after kez yol sorulduktan sonra
+    kurulur; böylece tek seferlik sorgular tam ağaç maliyeti ödemez, sık
+    sorgulanan (hub) kullanıcılar ise önbellekten yanıtlanır. Sayaçlar da
+    en fazla max_tracked kaynak için (en son sorgulananlar) tutulur.
+    """
+
+    def __init__(self, max_entries=500_000, cache_after=2, max_tracked=100_000):
+        self.max_entries = max_entries
+        self.cache_after = cache_after
+        self.max_tracked = max_tracked
+        self.trees = OrderedDict()  # kaynak -> ShortestPathTree (en son kullanılan sonda)
+        self.entries = 0
+        self.query_counts = {}      # kaynak -> sorgu sayısı (en son sorgulanan sonda)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.trees)
+
+    def get(self, source, version=None):
+        tree = self.trees.get(source)
+        if tree is None or (version is not None and tree.version != version):
+            if tree is not None:
+                self._drop(source)
+            self.misses += 1
+            return None
+        self.trees.move_to_end(source)
+        self.hits += 1
+        return tree
+
+    def put(self, tree):
+        """Ağacı önbelleğe ekle; tek başına max_entries'i aşıyorsa eklenmez ve False döner"""
+        if tree.source in self.trees:
+            self._drop(tree.source)
+        if len(tree) > self.max_entries:
+            return False
+        self.trees[tree.source] = tree
+        self.entries += len(tree)
+        while self.entries > self.max_entries:
+            self._drop(next(iter(self.trees)))
+        return True
+
+    def should_cache(self, source):
+        """
+        Kaynak için sorgu sayacını artır; eşiğe ulaştıysa ağaç kurulmalı.
+        Ağacı kurulacak kaynağın sayacı silinir (ağaç önbellekten düşerse
+        sayım baştan başlar); sayaç sayısı sınırı aşınca en eskisi atılır.
+        """
+        count = self.query_counts.pop(source, 0) + 1
+        if count >= self.cache_after:
+            return True
+        self.query_counts[source] = count
+        if len(self.query_counts) > self.max_tracked:
+            del self.query_counts[next(iter(self.query_counts))]
+        return False
+
+    def _drop(self, source):
+        tree = self.trees.pop(source)
+        self.entries -= len(tree)
+
+    def on_change(self, graph, touched=(), removed_edges=(), removed_nodes=()):
+        """
+        Tek bir mutasyon sonrası etkilenen ağaçları düşür, kalanların sürümünü
+        güncelle. Ağırlıklar karşılaştırma için önce hesaplanır.
+        """
+        for node_id in removed_nodes:
+            self.query_counts.pop(node_id, None)
+        if not self.trees:
+            return
+        graph.flush_weights()
+        for source in list(self.trees):
+            tree = self.trees[source]
+            if tree.is_affected(graph, touched, removed_edges, removed_nodes):
+                self._drop(source)
+            else:
+                tree.version = graph.version
+
+    def clear(self):
+        self.trees.clear()
+        self.entries = 0
+        self.query_counts.clear()
+
+    def __repr__(self):
+        return (f"ShortestPathCache(trees={len(self.trees)}, entries={self.entries}, "
+                f"hits={self.hits}, misses={self.misses})")
@@ -128,6 +128,24 @@ class PerformanceTester:
             'duration_ms': round(duration, 4)
         }
     
+    def test_betweenness(self):
+        """Aracılık merkeziliği (Brandes) performans testi"""
+        if not self.graph.nodes:
+            return None
+        
+        start_time = time.time()
+        scores = Algorithms.betweenness_centrality(self.graph)
+        end_time = time.time()
+        
+        duration = (end_time - start_time) * 1000
+        
+        return {
+            'algorithm': 'Betweenness',
+            'nodes_scored': len(scores),
+            'max_score': round(max(scores.values()), 4) if scores else 0,
+            'duration_ms': round(duration, 4)
+        }
+    
     def test_coloring(self):
         """Welsh-Powell renklendirme performans testi"""
         if not self.graph.nodes:
@@ -179,6 +197,7 @@ class PerformanceTester:
             ('Dijkstra', self.test_dijkstra),
             ('A*', self.test_astar),
             ('Degree Centrality', self.test_centrality),
+            ('Betweenness', self.test_betweenness),
             ('Welsh-Powell', self.test_coloring),
             ('Connected Components', self.test_connected_components)
         ]
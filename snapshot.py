@@ -0,0 +1,176 @@
+"""
+Sürümlü ikili (binary) graf formatı.
+
+Dosya düzeni (küçük-endian başlık):
+    başlık     : sihirli bayt 'SOSG', sürüm (u16), bayraklar (u16),
+                 düğüm sayısı (u64), komşuluk yuvası sayısı (u64)
+    bölüm tablosu: her bölüm için (başlangıç, bayt uzunluğu) - u64 çiftleri
+    bölümler   : ids (q), aktiflik (d), etkilesim (d), offsets (q),
+                 neighbors (i), weights (d), name_offsets (q), names (UTF-8)
+
+Her bölüm 8 bayt hizalıdır ve dosyaya makinenin yerel dizi düzeninde yazılır.
+load_snapshot dosyayı mmap ile açar ve CSRGraph'ı doğrudan dosya üzerindeki
+memoryview'larla kurar; diziler okunmaz ya da kopyalanmaz, işletim sistemi
+yalnızca erişilen sayfaları belleğe getirir.
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+
+from csr_graph import CSRGraph
+
+MAGIC = b'SOSG'
+VERSION = 1
+FLAG_BIG_ENDIAN = 0x1
+
+_HEADER = struct.Struct('<4sHHQQ')
+_SECTION = struct.Struct('<QQ')
+_ALIGN = 8
+
+# (bölüm adı, dizi tip kodu) - dosyadaki sıra
+_SECTIONS = (
+    ('ids', 'q'),
+    ('aktiflik', 'd'),
+    ('etkilesim', 'd'),
+    ('offsets', 'q'),
+    ('neighbors', 'i'),
+    ('weights', 'd'),
+    ('name_offsets', 'q'),
+    ('names', 'B'),
+)
+
+
+class SnapshotNames(Sequence):
+    """Snapshot'taki düğüm adları; her ad istendiğinde UTF-8 bloğundan çözülür"""
+    __slots__ = ('_offsets', '_blob')
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]], 'utf-8')
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+
+def _typed(data, typecode):
+    """Veriyi istenen tipte array'e çevir (zaten uygunsa kopyalamadan)"""
+    if isinstance(data, array) and data.typecode == typecode:
+        return data
+    return array(typecode, data)
+
+
+def save_snapshot(graph, filename):
+    """
+    Grafı ikili snapshot olarak kaydeder.
+
+    Args:
+        graph: SocialGraph, CompactSocialGraph ya da CSRGraph
+        filename: hedef dosya; önce geçici dosyaya yazılıp sonra yerine taşınır
+
+    Returns:
+        bool: başarılıysa True
+    """
+    try:
+        csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        names = csr.names if csr.names is not None else [''] * csr.num_nodes
+
+        name_offsets = array('q', [0])
+        blob = bytearray()
+        for name in names:
+            blob += str(name).encode('utf-8')
+            name_offsets.append(len(blob))
+
+        columns = {
+            'ids': _typed(csr.ids, 'q'),
+            'aktiflik': _typed(csr.aktiflik, 'd'),
+            'etkilesim': _typed(csr.etkilesim, 'd'),
+            'offsets': _typed(csr.offsets, 'q'),
+            'neighbors': _typed(csr.neighbors, 'i'),
+            'weights': _typed(csr.weights, 'd'),
+            'name_offsets': name_offsets,
+            'names': blob,
+        }
+
+        # Bölüm konumları: başlık + tablo, ardından 8 bayt hizalı bölümler
+        table = []
+        position = _HEADER.size + _SECTION.size * len(_SECTIONS)
+        for name, _ in _SECTIONS:
+            position += -position % _ALIGN
+            length = len(memoryview(columns[name]).cast('B'))
+            table.append((position, length))
+            position += length
+
+        flags = FLAG_BIG_ENDIAN if sys.byteorder == 'big' else 0
+        tmp_name = filename + '.tmp'
+        with open(tmp_name, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, flags, csr.num_nodes, len(columns['neighbors'])))
+            for start, length in table:
+                f.write(_SECTION.pack(start, length))
+            for (name, _), (start, _) in zip(_SECTIONS, table):
+                f.write(b'\0' * (start - f.tell()))
+                f.write(columns[name])
+        os.replace(tmp_name, filename)
+        return True
+    except Exception as e:
+        print(f"Snapshot kaydetme hatası: {e}")
+        return False
+
+
+def load_snapshot(filename, use_mmap=True):
+    """
+    Snapshot dosyasını salt okunur CSRGraph olarak açar.
+
+    Args:
+        filename: save_snapshot ile yazılmış dosya
+        use_mmap: True ise dosya belleğe eşlenir (sıfır kopya); False ise bir kez okunur
+
+    Returns:
+        CSRGraph: dizileri dosya üzerindeki memoryview'lar, names ise SnapshotNames
+
+    Raises:
+        ValueError: dosya bu formatta değilse, sürüm ya da bayt sırası uyumsuzsa
+    """
+    with open(filename, 'rb') as f:
+        if use_mmap:
+            buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            buffer = memoryview(f.read())
+
+    header_end = _HEADER.size + _SECTION.size * len(_SECTIONS)
+    if len(buffer) < header_end:
+        raise ValueError("Geçersiz snapshot: dosya çok kısa")
+    magic, version, flags, node_count, slot_count = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("Geçersiz snapshot: sihirli bayt uyuşmuyor")
+    if version != VERSION:
+        raise ValueError(f"Desteklenmeyen snapshot sürümü: {version}")
+    if bool(flags & FLAG_BIG_ENDIAN) != (sys.byteorder == 'big'):
+        raise ValueError("Snapshot farklı bayt sıralamasına sahip bir makinede yazılmış")
+
+    sections = {}
+    for k, (name, typecode) in enumerate(_SECTIONS):
+        start, length = _SECTION.unpack_from(buffer, _HEADER.size + k * _SECTION.size)
+        if start + length > len(buffer):
+            raise ValueError(f"Geçersiz snapshot: '{name}' bölümü dosya dışına taşıyor")
+        sections[name] = buffer[start:start + length].cast(typecode)
+
+    if len(sections['ids']) != node_count or len(sections['neighbors']) != slot_count:
+        raise ValueError("Geçersiz snapshot: bölüm uzunlukları başlıkla uyuşmuyor")
+
+    csr = CSRGraph(sections['ids'], sections['offsets'], sections['neighbors'], sections['weights'],
+                   sections['aktiflik'], sections['etkilesim'],
+                   SnapshotNames(sections['name_offsets'], sections['names']))
+    csr.source_path = os.path.abspath(filename)
+    return csr
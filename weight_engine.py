@@ -0,0 +1,89 @@
+"""
+Toplu kenar ağırlığı hesaplama.
+
+Edge.calculate_weight formülünü (1 + sqrt(dAktiflik^2 + dEtkilesim^2 + dBaglanti^2))
+tek tek kenarlar yerine sütun dizileri üzerinde tek seferde uygular. NumPy
+kuruluysa hesaplama vektörize yapılır, değilse aynı formül saf Python ile
+tek döngüde hesaplanır.
+"""
+import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsiyonel
+    np = None
+
+
+def weights_from_columns(src_aktiflik, dst_aktiflik, src_etkilesim, dst_etkilesim,
+                         src_baglanti, dst_baglanti):
+    """
+    Kenar uçlarının özellik sütunlarından ağırlık listesi üretir.
+    Tüm sütunlar aynı uzunlukta olmalıdır; i. eleman i. kenara aittir.
+    """
+    if np is not None:
+        diff_aktif = np.asarray(src_aktiflik, dtype=np.float64) - np.asarray(dst_aktiflik, dtype=np.float64)
+        diff_etkilesim = np.asarray(src_etkilesim, dtype=np.float64) - np.asarray(dst_etkilesim, dtype=np.float64)
+        diff_baglanti = np.asarray(src_baglanti, dtype=np.float64) - np.asarray(dst_baglanti, dtype=np.float64)
+        weights = 1.0 + np.sqrt(diff_aktif * diff_aktif + diff_etkilesim * diff_etkilesim
+                                + diff_baglanti * diff_baglanti)
+        return weights.tolist()
+
+    sqrt = math.sqrt
+    return [
+        1 + sqrt((a1 - a2) ** 2 + (e1 - e2) ** 2 + (b1 - b2) ** 2)
+        for a1, a2, e1, e2, b1, b2 in zip(src_aktiflik, dst_aktiflik, src_etkilesim,
+                                          dst_etkilesim, src_baglanti, dst_baglanti)
+    ]
+
+
+def weights_from_node_arrays(aktiflik, etkilesim, degrees, src, dst):
+    """
+    Düğüm sütunları (indeks -> aktiflik/etkileşim/derece) ve kenar uç indeksi
+    dizilerinden ağırlıkları hesaplar. Kenar başına Python objesi oluşturulmaz.
+
+    Returns:
+        array('d'): i. eleman src[i]-dst[i] kenarının ağırlığı
+    """
+    if np is not None:
+        akt = np.asarray(memoryview(aktiflik), dtype=np.float64)
+        etk = np.asarray(memoryview(etkilesim), dtype=np.float64)
+        deg = np.asarray(memoryview(degrees), dtype=np.float64)
+        s = np.asarray(memoryview(src))
+        d = np.asarray(memoryview(dst))
+        weights = 1.0 + np.sqrt((akt[s] - akt[d]) ** 2 + (etk[s] - etk[d]) ** 2 + (deg[s] - deg[d]) ** 2)
+        result = array('d')
+        result.frombytes(weights.tobytes())
+        return result
+
+    sqrt = math.sqrt
+    return array('d', (
+        1 + sqrt((aktiflik[i] - aktiflik[j]) ** 2 + (etkilesim[i] - etkilesim[j]) ** 2
+                 + (degrees[i] - degrees[j]) ** 2)
+        for i, j in zip(src, dst)
+    ))
+
+
+def compute_weights(edges):
+    """
+    Verilen kenarların ağırlıklarını tek geçişte hesaplayıp Edge objelerine yazar.
+    Elle atanmış (weight_overridden) ağırlıklara dokunulmaz.
+
+    Returns:
+        int: hesaplanan kenar sayısı
+    """
+    edges = [edge for edge in edges if not edge.weight_overridden]
+    if not edges:
+        return 0
+
+    weights = weights_from_columns(
+        [edge.source.aktiflik for edge in edges],
+        [edge.target.aktiflik for edge in edges],
+        [edge.source.etkilesim for edge in edges],
+        [edge.target.etkilesim for edge in edges],
+        [edge.source_baglanti for edge in edges],
+        [edge.target_baglanti for edge in edges],
+    )
+    for edge, weight in zip(edges, weights):
+        edge._weight = weight
+    return len(edges)